@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
-"""Script to run pylint with proper configuration."""
+"""Script to run pylint on the package and its tests with proper configuration."""
 
 import sys
-from scripts.pylint_runner import run_pylint
+from scripts.pylint_runner import get_changed_files, parse_args, run_pylint
+
+TARGETS = ["talkie", "tests"]
 
 
 if __name__ == "__main__":
-    exit_code = run_pylint("talkie", ["--ignore=tests"])
+    args = parse_args(__doc__)
+    files = get_changed_files(TARGETS, args.base) if args.changed else None
+    exit_code = run_pylint(
+        TARGETS, jobs=args.jobs, use_cache=args.use_cache, files=files
+    )
     sys.exit(exit_code)
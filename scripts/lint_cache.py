@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Incremental cache of per-file pylint results.
+
+Files are looked up by ``(mtime_ns, size)`` first and by a BLAKE2b digest of
+their contents second, so unchanged files are never handed to pylint again.
+The whole cache is namespaced by the pylint version and the project's pylint
+configuration: changing either invalidates every entry.
+
+Entries are keyed on each file's own contents only. Messages that depend on
+other modules (the import-error and no-member family, cyclic-import) are
+therefore re-checked only for files that changed; run with ``--no-cache``
+after changing a module's interface to refresh them everywhere.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+CACHE_DIR_NAME = ".talkie-lint-cache"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+CACHE_MAX_ENTRIES = 2000
+CONFIG_FILES = ("pyproject.toml", ".pylintrc", "setup.cfg")
+
+
+def iter_python_files(root: Path, target: str) -> Iterator[str]:
+    """Yield project-relative paths of all .py files below target."""
+    stack = [root / target]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            continue
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__" and not entry.name.startswith("."):
+                    stack.append(Path(entry.path))
+            elif entry.name.endswith(".py"):
+                yield Path(entry.path).relative_to(root).as_posix()
+
+
+def _file_digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def compute_namespace(root: Path, extra: List[str]) -> str:
+    """Build the cache namespace from pylint version, config files and args."""
+    try:
+        from pylint import __version__ as pylint_version
+    except ImportError:
+        pylint_version = "unknown"
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pylint_version.encode("utf-8"))
+    for name in CONFIG_FILES:
+        config_path = root / name
+        if config_path.is_file():
+            h.update(name.encode("utf-8"))
+            h.update(config_path.read_bytes())
+    for arg in extra:
+        h.update(arg.encode("utf-8"))
+    return h.hexdigest()
+
+
+class LintCache:
+    """Per-file pylint message cache persisted under the project root."""
+
+    def __init__(self, root: Path, namespace: str, name: str = "index"):
+        self.root = root
+        self.namespace = namespace
+        self.cache_dir = root / CACHE_DIR_NAME
+        self.index_file = self.cache_dir / f"{name}.bin"
+        self.lock_file = self.cache_dir / f"{name}.lock"
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_file, "rb") as f:
+                data: Any = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            return {}
+        if not isinstance(data, dict) or data.get("namespace") != self.namespace:
+            return {}
+        entries: Dict[str, Dict[str, Any]] = data.get("entries", {})
+        return entries
+
+    def lookup(self, rel_path: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached messages for an unchanged file, or None on a miss."""
+        entry = self.entries.get(rel_path)
+        if entry is None:
+            return None
+
+        path = self.root / rel_path
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+
+        messages: List[Dict[str, Any]] = entry["messages"]
+        if entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return messages
+
+        # Touched but possibly unchanged (checkout, rebase): compare contents.
+        if entry["size"] == st.st_size and entry["digest"] == _file_digest(path):
+            entry["mtime_ns"] = st.st_mtime_ns
+            return messages
+
+        return None
+
+    def store(self, rel_path: str, messages: List[Dict[str, Any]]) -> None:
+        """Record pylint messages for a file as of its current contents."""
+        path = self.root / rel_path
+        try:
+            st = path.stat()
+            digest = _file_digest(path)
+        except FileNotFoundError:
+            return
+        self.entries[rel_path] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "digest": digest,
+            "messages": messages,
+            "stored_at": time.time(),
+        }
+
+    def _evict(self) -> None:
+        cutoff = time.time() - CACHE_TTL_SECONDS
+        expired = [k for k, v in self.entries.items() if v["stored_at"] < cutoff]
+        for key in expired:
+            del self.entries[key]
+
+        if len(self.entries) > CACHE_MAX_ENTRIES:
+            oldest = sorted(self.entries, key=lambda k: self.entries[k]["stored_at"])
+            for key in oldest[: len(self.entries) - CACHE_MAX_ENTRIES]:
+                del self.entries[key]
+
+    def save(self) -> None:
+        """Write the index back to disk, holding an exclusive lock if possible."""
+        self._evict()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_file, "w") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                tmp_file = self.index_file.with_suffix(".tmp")
+                with open(tmp_file, "wb") as f:
+                    pickle.dump(
+                        {"namespace": self.namespace, "entries": self.entries},
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            print(f"Warning: could not write lint cache: {e}")
@@ -1,36 +1,287 @@
 #!/usr/bin/env python3
 """Common pylint runner module."""
 
+import argparse
+import contextlib
+import io
+import json
+import os
 import subprocess
 import sys
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from scripts.lint_cache import (
+    CONFIG_FILES,
+    LintCache,
+    compute_namespace,
+    iter_python_files,
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+# pylint's persistent data (previous run stats); CI caches this directory
+PYLINT_HOME_DIR = ".pylint-cache"
+
+# pylint's bit-encoded exit status, by message type
+MESSAGE_STATUS_BITS = {
+    "fatal": 1,
+    "error": 2,
+    "warning": 4,
+    "refactor": 8,
+    "convention": 16,
+}
+
+
+def parse_args(
+    description: str, argv: Optional[List[str]] = None
+) -> argparse.Namespace:
+    """Parse command line arguments shared by the lint scripts.
+
+    Args:
+        description: Script description for --help
+        argv: Arguments to parse (defaults to sys.argv)
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of pylint worker processes (0 = one per CPU, 1 = serial)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Lint every file, ignoring results cached by previous runs",
+    )
+    parser.add_argument(
+        "--changed",
+        action="store_true",
+        help="Lint only Python files changed relative to --base (and untracked ones)",
+    )
+    parser.add_argument(
+        "--base",
+        default="HEAD",
+        help="Git ref to diff against with --changed (e.g. origin/main in CI)",
+    )
+    return parser.parse_args(argv)
+
+
+def _git_lines(args: List[str]) -> List[str]:
+    output = subprocess.check_output(
+        ["git", *args], cwd=PROJECT_ROOT, text=True, stderr=subprocess.DEVNULL
+    )
+    return [line for line in output.splitlines() if line]
+
+
+def get_changed_files(targets: List[str], base: str = "HEAD") -> Optional[List[str]]:
+    """List Python files under targets that differ from base.
 
-def run_pylint(target: str, additional_args: list = None):
-    """Run pylint on specified target.
-    
     Args:
-        target: Target to lint (e.g., 'talkie', 'tests')
+        targets: Packages to consider (e.g., ['talkie', 'tests'])
+        base: Git ref to compare the working tree against
+
+    Returns:
+        Changed files, or None if the whole tree must be linted because a
+        pylint configuration file changed or git is unavailable
+    """
+    try:
+        merge_base = _git_lines(["merge-base", base, "HEAD"])
+        since = merge_base[0] if merge_base else base
+        changed = _git_lines(["diff", "--name-only", "--diff-filter=ACMR", since])
+        changed += _git_lines(["ls-files", "--others", "--exclude-standard"])
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    if any(Path(name).name in CONFIG_FILES for name in changed):
+        return None
+
+    prefixes = tuple(f"{target.rstrip('/')}/" for target in targets)
+    return sorted(
+        {
+            name
+            for name in changed
+            if name.endswith(".py")
+            and name.startswith(prefixes)
+            and (PROJECT_ROOT / name).is_file()
+        }
+    )
+
+
+@contextlib.contextmanager
+def _working_directory(path: Path) -> Iterator[None]:
+    """Temporarily change the working directory (contextlib.chdir on 3.11+)."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _invoke_pylint(
+    project_root: Path, args: List[str], jobs: int, capture: bool = False
+) -> Tuple[int, Optional[str], str]:
+    """Run pylint and return (exit code, stdout if captured, stderr).
+
+    Serial runs call pylint in this interpreter, saving a Python startup
+    and astroid import. Parallel runs still go through a subprocess because
+    pylint forks its workers from global state that ``Run`` leaves behind.
+    """
+    args = [*args, "--persistent=y", f"--jobs={jobs}"]
+    pylint_home = str(project_root / PYLINT_HOME_DIR)
+    if jobs != 1:
+        result = subprocess.run(
+            [sys.executable, "-m", "pylint", *args],
+            cwd=project_root,
+            env={**os.environ, "PYLINTHOME": pylint_home},
+            capture_output=capture,
+            text=True,
+            check=False,
+        )
+        return result.returncode, result.stdout, result.stderr or ""
+
+    # pylint resolves PYLINTHOME when it is first imported
+    os.environ["PYLINTHOME"] = pylint_home
+    from pylint.lint import Run
+
+    stdout = io.StringIO() if capture else None
+    with _working_directory(project_root):
+        if stdout is not None:
+            with contextlib.redirect_stdout(stdout):
+                run = Run(args, exit=False)
+        else:
+            run = Run(args, exit=False)
+    return run.linter.msg_status, stdout.getvalue() if stdout else None, ""
+
+
+def _format_message(message: Dict[str, Any]) -> str:
+    return (
+        f"{message['path']}:{message['line']}:{message['column']}: "
+        f"{message['message-id']}: {message['message']} ({message['symbol']})"
+    )
+
+
+def _emit_messages(messages: List[Dict[str, Any]]) -> None:
+    """Pretty-print messages on a terminal, otherwise dump them as JSON."""
+    if sys.stdout.isatty():
+        for message in messages:
+            print(_format_message(message))
+    else:
+        print(json.dumps(messages, indent=2))
+
+
+def _run_pylint_json(
+    project_root: Path,
+    targets: List[str],
+    additional_args: List[str],
+    jobs: int,
+    files: Optional[List[str]] = None,
+    use_cache: bool = True,
+) -> int:
+    """Lint with JSON output, replaying cached results for unchanged files."""
+    if files is None:
+        files = [
+            rel_path
+            for target in targets
+            for rel_path in iter_python_files(project_root, target)
+        ]
+    cache = None
+    if use_cache:
+        namespace = compute_namespace(project_root, [*targets, *additional_args])
+        cache = LintCache(project_root, namespace)
+
+    messages_by_file: Dict[str, List[Dict[str, Any]]] = {}
+    misses = []
+    for rel_path in files:
+        cached = cache.lookup(rel_path) if cache is not None else None
+        if cached is None:
+            misses.append(rel_path)
+        else:
+            messages_by_file[rel_path] = cached
+
+    if misses:
+        returncode, stdout, stderr = _invoke_pylint(
+            project_root,
+            [*misses, "--output-format=json", "--score=n", *additional_args],
+            jobs,
+            capture=True,
+        )
+        try:
+            fresh = json.loads(stdout or "[]")
+        except json.JSONDecodeError:
+            fresh = None
+        if fresh is None or returncode & 32:
+            # Usage error or crash: show pylint's output and cache nothing
+            print(stdout, end="")
+            print(stderr, end="", file=sys.stderr)
+            return returncode or 1
+
+        for rel_path in misses:
+            messages_by_file[rel_path] = []
+        for message in fresh:
+            rel_path = Path(message["path"]).as_posix()
+            messages_by_file.setdefault(rel_path, []).append(message)
+        if cache is not None:
+            for rel_path in misses:
+                cache.store(rel_path, messages_by_file[rel_path])
+            cache.save()
+
+    messages = [
+        message for rel_path in files for message in messages_by_file.get(rel_path, [])
+    ]
+    exit_code = 0
+    for message in messages:
+        exit_code |= MESSAGE_STATUS_BITS.get(message["type"], 0)
+
+    _emit_messages(messages)
+    summary = f"Linted {len(misses)} file(s)"
+    if cache is not None:
+        summary += f", {len(files) - len(misses)} unchanged (cached)"
+    print(summary, file=sys.stderr)
+    return exit_code
+
+
+def run_pylint(
+    targets: List[str],
+    additional_args: list = None,
+    jobs: int = 0,
+    use_cache: bool = True,
+    files: Optional[List[str]] = None,
+):
+    """Run a single pylint process over the specified targets.
+
+    Linting all targets in one process lets astroid parse shared modules
+    (e.g. ``talkie`` imported from ``tests``) only once. Messages are
+    collected as JSON and printed one per line on a terminal, or as a JSON
+    list when stdout is piped.
+
+    Args:
+        targets: Packages to lint (e.g., ['talkie', 'tests'])
         additional_args: Additional pylint arguments
-        
+        jobs: Number of pylint worker processes; 0 lets pylint use all CPUs.
+            Parallel mode skips cyclic-import checks, so pass 1 to get them.
+        use_cache: Skip files unchanged since the last run and replay their
+            cached messages
+        files: Lint only these project-relative files instead of the
+            whole targets (see get_changed_files)
+
     Returns:
         Exit code from pylint
     """
-    project_root = Path(__file__).parent.parent
-    
-    cmd = [
-        sys.executable, "-m", "pylint",
-        target,
-        "--score=y",
-        "--reports=y"
-    ]
-    
-    if additional_args:
-        cmd.extend(additional_args)
-    
+    project_root = PROJECT_ROOT
+
+    if files is not None and not files:
+        print("No changed Python files to lint", file=sys.stderr)
+        return 0
+
     try:
-        result = subprocess.run(cmd, cwd=project_root, check=False)
-        return result.returncode
+        return _run_pylint_json(
+            project_root, targets, additional_args or [], jobs, files, use_cache
+        )
     except Exception as e:
         print(f"Error running pylint: {e}")
         return 1
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, List, Optional
 
-from talkie.core.client import HttpClient
+from talkie.core.client import HttpClient, get_shared_client
 from talkie.utils.config import Config, load_config
 from talkie.utils.history import add_to_history
 
@@ -77,6 +77,7 @@ def execute_request(
     *,
     config: Optional[Config] = None,
     header_pairs: Optional[List[str]] = None,
+    headers: Optional[Dict[str, str]] = None,
     query_pairs: Optional[List[str]] = None,
     json_body: Optional[Any] = None,
     data_dict: Optional[Dict[str, Any]] = None,
@@ -86,10 +87,18 @@ def execute_request(
     follow_redirects: bool = True,
     record_history: bool = True,
 ) -> Dict[str, Any]:
-    """Perform HTTP request; returns status, headers, body, elapsed_seconds, url, method."""
+    """Perform HTTP request.
+
+    Returns status, headers, body (text), content (raw bytes), elapsed_seconds,
+    url and method.
+    """
+    method = method.upper()
     cfg = config or load_config()
     full_url = resolve_url(url, cfg)
-    req_headers = parse_header_pairs(header_pairs or [])
+    # Already-parsed headers (history, curl import) skip the "Name: value" round trip
+    req_headers = dict(headers) if headers else {}
+    if header_pairs:
+        req_headers.update(parse_header_pairs(header_pairs))
     headers = merge_headers(cfg, req_headers)
     params = parse_query_pairs(query_pairs) if query_pairs else {}
 
@@ -109,17 +118,19 @@ def execute_request(
         timeout=timeout,
         follow_redirects=follow_redirects,
         verify=verify,
+        client=get_shared_client(verify),
     ) as hc:
-        result = hc.request(method.upper(), full_url, **req_kwargs)
+        result = hc.request(method, full_url, **req_kwargs)
 
     elapsed = result.get("elapsed_seconds") or 0.0
     out = {
         "status": result["status"],
         "headers": result["headers"],
         "body": result["body"],
+        "content": result["response"].content,
         "elapsed_seconds": elapsed,
         "url": full_url,
-        "method": method.upper(),
+        "method": method,
         "request_headers": headers,
     }
 
@@ -134,7 +145,7 @@ def execute_request(
                 raw_body[:5000] if isinstance(raw_body, str) and len(raw_body) > 5000 else raw_body
             )
         add_to_history(
-            method=method.upper(),
+            method=method,
             url=full_url,
             headers=headers,
             data=hist_payload,
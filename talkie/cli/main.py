@@ -3,29 +3,49 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import itertools
 import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
 import time
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Set
 
 import httpx
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
+from rich.text import Text
 
 from talkie.__version__ import __version__
-from talkie.cli.curl_parser import parse_curl_command
-from talkie.cli.execute import execute_request, parse_httpie_items
+from talkie.cli.execute import (
+    execute_request,
+    merge_headers,
+    parse_header_pairs,
+    parse_httpie_items,
+    parse_query_pairs,
+    resolve_url,
+)
 from talkie.cli.parallel_parse import ParallelJob, parse_parallel_line
+from talkie.core.client import HTTP2_AVAILABLE
+from talkie.utils.colors import get_status_color
 from talkie.utils.config import load_config
 from talkie.utils.curl_generator import generate_curl_command
-from talkie.utils.formatter import DataFormatter, detect_content_type
-from talkie.utils.graphql import GraphQLClient
+from talkie.utils.formatter import (
+    DataFormatter,
+    detect_content_type,
+    dump_json,
+    get_syntax_theme,
+    load_json,
+)
 from talkie.utils.history import get_history_manager
-from talkie.utils.openapi import OpenAPIClient, validate_openapi_spec
 
 app = typer.Typer(
     name="talkie",
@@ -71,10 +91,23 @@ def main_callback(
 ) -> None:
     """Talkie CLI."""
     if ctx.invoked_subcommand is None:
+        from rich.markdown import Markdown
+
         console.print(Panel.fit(f"Talkie {__version__}\nRun [cyan]talkie --help[/cyan] for commands."))
         console.print(Markdown(EXAMPLES))
 
 
+_formatter: Optional[DataFormatter] = None
+
+
+def _get_formatter() -> DataFormatter:
+    """Get the stdout formatter shared by response and file output."""
+    global _formatter
+    if _formatter is None:
+        _formatter = DataFormatter(console=Console())
+    return _formatter
+
+
 def _human_http_error(exc: BaseException) -> None:
     if isinstance(exc, httpx.TimeoutException):
         console.print("[red]Request timed out.[/red] Try a larger [cyan]--timeout[/cyan].")
@@ -110,7 +143,9 @@ def _print_response(
             headers=req_h,
             params=qh or None,
         )
-        console.print(Panel(curl, title="curl", border_style="dim"))
+        # Text, not a markup string: no markup parse, and "[...]" in headers
+        # or URLs is printed verbatim
+        console.print(Panel(Text(curl), title="curl", border_style="dim"))
 
     if verbose:
         console.print(
@@ -132,12 +167,12 @@ def _print_response(
     body = result.get("body") or ""
     if json_only:
         try:
-            parsed = json.loads(body)
+            parsed = load_json(body)
             console.print(
                 Syntax(
-                    json.dumps(parsed, indent=2, ensure_ascii=False),
+                    dump_json(parsed),
                     "json",
-                    theme="monokai",
+                    theme=get_syntax_theme(),
                     word_wrap=True,
                 )
             )
@@ -145,8 +180,11 @@ def _print_response(
             console.print(body)
         return
 
-    fmt = DataFormatter(console=Console())
-    ct = output_format or result["headers"].get("content-type", "").split(";")[0].strip()
+    fmt = _get_formatter()
+    # MIME types are case-insensitive; the formatter compares lowercase names
+    ct = output_format or (
+        result["headers"].get("content-type", "").partition(";")[0].strip().lower()
+    )
     if not ct:
         ct = detect_content_type(body)
         mime = {
@@ -181,13 +219,16 @@ def _run_http(
     output_path: Optional[Path],
     timeout: float,
     insecure: bool,
+    *,
+    parsed_headers: Optional[Dict[str, str]] = None,
+    json_data: Any = None,
 ) -> None:
     cfg = load_config()
 
-    jb: Any = None
-    if json_body is not None:
+    jb: Any = json_data
+    if jb is None and json_body is not None:
         jb = json.loads(json_body)
-    elif body_items:
+    elif jb is None and body_items:
         jb = parse_httpie_items(body_items)
 
     try:
@@ -196,6 +237,7 @@ def _run_http(
             url,
             config=cfg,
             header_pairs=headers,
+            headers=parsed_headers,
             query_pairs=query,
             json_body=jb,
             raw_body=raw_body,
@@ -221,7 +263,11 @@ def _run_http(
     )
 
     if output_path:
-        output_path.write_text(result.get("body") or "", encoding="utf-8")
+        # Save the body as received: no decode/re-encode, binary bodies intact
+        content = result.get("content")
+        if content is None:
+            content = (result.get("body") or "").encode("utf-8")
+        output_path.write_bytes(content)
         console.print(f"[green]Wrote[/green] {output_path}")
 
 
@@ -245,6 +291,8 @@ def demo_cmd() -> None:
             timeout=15.0,
         )
     except Exception as exc:
+        from rich.markdown import Markdown
+
         console.print(f"[yellow]Demo request skipped (offline?):[/yellow] {exc}")
         console.print(Markdown("Try: `talkie get https://httpbin.org/get` when online."))
         raise typer.Exit(0) from exc
@@ -268,6 +316,8 @@ def from_curl_cmd(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show parsed request only."),
 ) -> None:
     """Replay a curl one-liner as an HTTP request."""
+    from talkie.cli.curl_parser import parse_curl_command
+
     try:
         parsed = parse_curl_command(curl)
     except ValueError as exc:
@@ -278,67 +328,27 @@ def from_curl_cmd(
         console.print_json(data=parsed)
         return
 
-    hdrs = [f"{k}: {v}" for k, v in parsed["headers"].items()]
-    method = parsed["method"]
-    url = parsed["url"]
     jb = parsed.get("data")
-    raw = None
-    if isinstance(jb, (dict, list)):
-        body_items: List[str] = []
-        json_str = json.dumps(jb)
-        _run_http(
-            method,
-            url,
-            hdrs,
-            [],
-            body_items,
-            raw_body=None,
-            json_body=json_str,
-            verbose=True,
-            json_only=False,
-            headers_only=False,
-            output_format=None,
-            show_curl=False,
-            output_path=None,
-            timeout=30.0,
-            insecure=bool(parsed.get("insecure")),
-        )
-    elif jb is not None:
-        _run_http(
-            method,
-            url,
-            hdrs,
-            [],
-            [],
-            raw_body=str(jb),
-            json_body=None,
-            verbose=True,
-            json_only=False,
-            headers_only=False,
-            output_format=None,
-            show_curl=False,
-            output_path=None,
-            timeout=30.0,
-            insecure=bool(parsed.get("insecure")),
-        )
-    else:
-        _run_http(
-            method,
-            url,
-            hdrs,
-            [],
-            [],
-            raw_body=None,
-            json_body=None,
-            verbose=True,
-            json_only=False,
-            headers_only=False,
-            output_format=None,
-            show_curl=False,
-            output_path=None,
-            timeout=30.0,
-            insecure=bool(parsed.get("insecure")),
-        )
+    is_json = isinstance(jb, (dict, list))
+    _run_http(
+        parsed["method"],
+        parsed["url"],
+        [],
+        [],
+        [],
+        raw_body=None if jb is None or is_json else str(jb),
+        json_body=None,
+        verbose=True,
+        json_only=False,
+        headers_only=False,
+        output_format=None,
+        show_curl=False,
+        output_path=None,
+        timeout=30.0,
+        insecure=bool(parsed.get("insecure")),
+        parsed_headers=parsed["headers"],
+        json_data=jb if is_json else None,
+    )
 
 
 @app.command("curl")
@@ -350,13 +360,12 @@ def curl_only_cmd(
 ) -> None:
     """Print an equivalent curl command (no network)."""
     cfg = load_config()
-    from talkie.cli.execute import merge_headers, parse_header_pairs, parse_query_pairs, resolve_url
 
     full = resolve_url(url, cfg)
     merged = merge_headers(cfg, parse_header_pairs(header))
     qh = parse_query_pairs(query)
     line = generate_curl_command(method.upper(), full, headers=merged, params=qh or None)
-    console.print(line)
+    console.print(Text(line))
 
 
 def _register_http_method(method: str, *, allow_positional_body: bool) -> None:
@@ -543,12 +552,13 @@ def history_search(
         domain=domain,
         sort=order,
     )
-    console.print(f"[dim]{len(found)} match(es)[/dim]")
-    for e in found[-50:]:
-        console.print(
-            f"[cyan]{e.get('id', '')[:8]}[/cyan] {e.get('timestamp')} "
-            f"{e.get('method')} {e.get('response_status')} {e.get('url')}"
-        )
+    lines = [f"[dim]{len(found)} match(es)[/dim]"]
+    lines.extend(
+        f"[cyan]{e.get('id', '')[:8]}[/cyan] {e.get('timestamp')} "
+        f"{e.get('method')} {e.get('response_status')} {e.get('url')}"
+        for e in found[-50:]
+    )
+    console.print("\n".join(lines))
 
 
 @history_app.command("repeat")
@@ -572,18 +582,18 @@ def history_repeat(
     method = str(match.get("method", "GET"))
     url = str(match.get("url", ""))
     hdrs_dict = match.get("headers") or {}
-    hdrs = [f"{k}: {v}" for k, v in hdrs_dict.items() if v != "***"]
+    hdrs = {k: str(v) for k, v in hdrs_dict.items() if v != "***"}
     data = match.get("data")
-    json_body = json.dumps(data) if isinstance(data, (dict, list)) else None
-    raw = None if json_body else (str(data) if data is not None else None)
+    is_json = isinstance(data, (dict, list))
+    raw = None if is_json or data is None else str(data)
     _run_http(
         method,
         url,
-        hdrs,
+        [],
         [],
         [],
         raw,
-        json_body,
+        None,
         True,
         False,
         False,
@@ -592,6 +602,8 @@ def history_repeat(
         None,
         30.0,
         False,
+        parsed_headers=hdrs,
+        json_data=data if is_json else None,
     )
 
 
@@ -626,6 +638,8 @@ def openapi_cmd(
     examples: bool = typer.Option(False, "--examples", help="Show sample operations."),
 ) -> None:
     """Quick inspect: load spec, validate basics, list operations."""
+    from talkie.utils.openapi import OpenAPIClient, validate_openapi_spec
+
     try:
         client = OpenAPIClient(source)
     except (FileNotFoundError, ValueError) as exc:
@@ -647,25 +661,70 @@ def openapi_cmd(
     )
 
     if endpoints_only:
-        for p in client.get_endpoints():
-            methods = ", ".join(client.get_methods_for_path(p))
-            console.print(f"[cyan]{p}[/cyan] [dim]{methods}[/dim]")
+        lines = [
+            f"[cyan]{p}[/cyan] [dim]{', '.join(client.get_methods_for_path(p))}[/dim]"
+            for p in client.get_endpoints()
+        ]
+        if lines:
+            console.print("\n".join(lines))
         return
 
+    ops = client.iter_operations()
     if examples:
-        for op in client.operations[:15]:
+        for op in itertools.islice(ops, 15):
             ex = client.generate_request_example(op["path"], op["method"])
             if ex:
                 console.print_json(data=ex)
-        if len(client.operations) > 15:
-            console.print(f"[dim]… and {len(client.operations) - 15} more[/dim]")
+        remaining = sum(1 for _ in ops)
+        if remaining:
+            console.print(f"[dim]… and {remaining} more[/dim]")
         return
 
-    for op in client.operations[:40]:
-        summ = (op.get("operation") or {}).get("summary", "")
-        console.print(f"{op['method']:7} {op['path']}  [dim]{summ}[/dim]")
-    if len(client.operations) > 40:
-        console.print(f"[dim]… {len(client.operations) - 40} more (use --endpoints)[/dim]")
+    lines = [
+        f"{op['method']:7} {op['path']}  "
+        f"[dim]{(op.get('operation') or {}).get('summary', '')}[/dim]"
+        for op in itertools.islice(ops, 40)
+    ]
+    remaining = sum(1 for _ in ops)
+    if remaining:
+        lines.append(f"[dim]… {remaining} more (use --endpoints)[/dim]")
+    if lines:
+        console.print("\n".join(lines))
+
+
+@app.command("generate-client")
+def generate_client_cmd(
+    source: str = typer.Argument(..., help="URL or path to OpenAPI JSON/YAML."),
+    output: Path = typer.Option(
+        Path("generated_client"), "-o", "--output",
+        help="Directory for the generated package.",
+    ),
+    class_name: str = typer.Option(
+        "ApiClient", "--class-name", help="Generated client class."
+    ),
+) -> None:
+    """Generate a Python client package from an OpenAPI spec."""
+    from rich.tree import Tree
+
+    from talkie.utils.openapi_generator import OpenApiClientGenerator
+
+    try:
+        generator = OpenApiClientGenerator(source, class_name=class_name)
+        generator.generate_client(str(output))
+    except (FileNotFoundError, ValueError) as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(2) from exc
+
+    # Build the whole listing first and render it with a single print
+    tree = Tree(f"[green]Generated[/green] {output}")
+    files = sorted(
+        p.relative_to(output).as_posix() for p in output.rglob("*") if p.is_file()
+    )
+    for name in files:
+        tree.add(name)
+    methods = ", ".join(m.name for m in generator.generated_methods)
+    tree.add(f"[dim]{len(generator.generated_methods)} method(s): {methods}[/dim]")
+    console.print(tree)
 
 
 @app.command("graphql")
@@ -704,6 +763,8 @@ def graphql_cmd(
             a, b = h.split(":", 1)
             hdrs[a.strip()] = b.strip()
 
+    from talkie.utils.graphql import GraphQLClient
+
     client = GraphQLClient(endpoint, hdrs)
     try:
         resp = client.query(q, variables or None)
@@ -716,9 +777,9 @@ def graphql_cmd(
     if resp.data is not None:
         console.print(
             Syntax(
-                json.dumps(resp.data, indent=2, ensure_ascii=False),
+                dump_json(resp.data),
                 "json",
-                theme="monokai",
+                theme=get_syntax_theme(),
                 word_wrap=True,
             )
         )
@@ -732,7 +793,7 @@ def format_cmd(
 ) -> None:
     """Format JSON/XML/HTML file."""
     text = path.read_text(encoding="utf-8")
-    fmt = DataFormatter(console=Console())
+    fmt = _get_formatter()
     ct = type_override or detect_content_type(text)
     mime = {
         "json": "application/json",
@@ -746,6 +807,29 @@ def format_cmd(
         console.print(rendered)
 
 
+def _use_uvloop() -> None:
+    """Use uvloop for asyncio when installed (it is POSIX-only)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+_RESULT_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_result_file(output_dir: bytes, index: int, payload: bytes) -> None:
+    """Write one response body with raw fd I/O (no text layer or encoding)."""
+    fd = os.open(output_dir + b"resp_%d.txt" % index, _RESULT_FILE_FLAGS, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 @app.command("parallel")
 def parallel_cmd(
     file: Optional[Path] = typer.Option(None, "-f", "--file", help="One request per line."),
@@ -755,76 +839,258 @@ def parallel_cmd(
     concurrency: int = typer.Option(5, "--concurrency"),
     delay: float = typer.Option(0.0, "--delay"),
     output_dir: Optional[Path] = typer.Option(None, "--output-dir"),
+    output_format: str = typer.Option(
+        "files",
+        "--output-format",
+        help="files (resp_<n>.txt each) | jsonl (one results.jsonl)",
+    ),
+    http1: bool = typer.Option(
+        False, "--http1", help="Disable HTTP/2 (used when the h2 package is installed)."
+    ),
 ) -> None:
     """Run many HTTP requests concurrently (GET/POST/…; file lines per README)."""
-    lines: List[str] = []
-    if file:
-        lines = [
-            ln.strip()
-            for ln in file.read_text(encoding="utf-8").splitlines()
-            if ln.strip() and not ln.strip().startswith("#")
-        ]
-    jobs: List[ParallelJob] = []
-    for ln in lines:
-        try:
-            jobs.append(parse_parallel_line(ln))
-        except ValueError as exc:
-            console.print(f"[red]Bad line[/red] {ln!r}: {exc}")
-            raise typer.Exit(2) from exc
-
-    base_url = (base or "").rstrip("/")
-    for u in urls:
-        if u.startswith("http://") or u.startswith("https://"):
-            jobs.append(ParallelJob(method=method.upper(), url=u))
-        elif base_url:
-            path = u if u.startswith("/") else f"/{u}"
-            jobs.append(ParallelJob(method=method.upper(), url=f"{base_url}{path}"))
-        else:
-            jobs.append(ParallelJob(method=method.upper(), url=u))
-
-    if not jobs:
-        console.print("[red]No requests. Use -f or -u.[/red]")
+    if output_format not in ("files", "jsonl"):
+        console.print("[red]--output-format must be files or jsonl[/red]")
         raise typer.Exit(2)
 
+    if concurrency < 1:
+        console.print("[red]--concurrency must be at least 1[/red]")
+        raise typer.Exit(2)
+
+    def iter_jobs(source: Optional[IO[str]]) -> Iterator[ParallelJob]:
+        # Stream the file line by line so large request files are never held whole
+        if source is not None:
+            for ln in source:
+                ln = ln.strip()
+                if not ln or ln.startswith("#"):
+                    continue
+                try:
+                    yield parse_parallel_line(ln)
+                except ValueError as exc:
+                    console.print(f"[red]Bad line[/red] {ln!r}: {exc}")
+                    raise typer.Exit(2) from exc
+
+        base_url = (base or "").rstrip("/")
+        for u in urls:
+            if u.startswith("http://") or u.startswith("https://"):
+                yield ParallelJob(method=method.upper(), url=u)
+            elif base_url:
+                path = u if u.startswith("/") else f"/{u}"
+                yield ParallelJob(method=method.upper(), url=f"{base_url}{path}")
+            else:
+                yield ParallelJob(method=method.upper(), url=u)
+
     cfg = load_config()
-    from talkie.cli.execute import resolve_url
-
-    async def run_all() -> List[Dict[str, Any]]:
-        sem = asyncio.Semaphore(concurrency)
-
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-
-            async def one(job: ParallelJob) -> Dict[str, Any]:
-                async with sem:
-                    if delay:
-                        await asyncio.sleep(delay)
-                    u = job.url
-                    url = resolve_url(u, cfg) if not (
-                        u.startswith("http://") or u.startswith("https://")
-                    ) else u
-                    req_kw: Dict[str, Any] = {}
-                    if job.method in ("POST", "PUT", "PATCH") and job.json_body is not None:
-                        req_kw["json"] = job.json_body
-                    t0 = time.perf_counter()
-                    r = await client.request(job.method, url, **req_kw)
-                    dt = time.perf_counter() - t0
-                    return {
-                        "method": job.method,
-                        "url": url,
-                        "status": r.status_code,
-                        "body": r.text,
-                        "elapsed": dt,
-                    }
-
-            return await asyncio.gather(*[one(j) for j in jobs])
-
-    results = asyncio.run(run_all())
-    for i, res in enumerate(results):
-        console.print(f"[cyan]{res['status']}[/cyan] {res['elapsed']:.3f}s {res['url']}")
-        if output_dir:
-            p = output_dir / f"resp_{i}.txt"
-            p.parent.mkdir(parents=True, exist_ok=True)
-            p.write_text(res["body"], encoding="utf-8")
+    # Distinct resolved URLs; batches often repeat the same endpoints
+    resolved: Dict[str, str] = {}
+
+    def resolve(job: ParallelJob) -> str:
+        url = resolved.get(job.url)
+        if url is None:
+            try:
+                url = resolved[job.url] = resolve_url(job.url, cfg)
+            except ValueError as exc:
+                console.print(f"[red]{exc}[/red]")
+                raise typer.Exit(2) from exc
+        return url
+
+    source: Optional[IO[str]] = None
+    if file:
+        source = file.open(encoding="utf-8")
+        if not file.is_file():
+            # A pipe can be read only once: spool it so it can be read again
+            with source:
+                spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+                shutil.copyfileobj(source, spool)
+            spool.seek(0)
+            source = spool
+    # Validate every line before the first request is sent, then rewind
+    job_count = 0
+    try:
+        for job in iter_jobs(source):
+            resolve(job)
+            job_count += 1
+        if not job_count:
+            console.print("[red]No requests. Use -f or -u.[/red]")
+            raise typer.Exit(2)
+    except typer.Exit:
+        if source is not None:
+            source.close()
+        raise
+    if source is not None:
+        source.seek(0)
+
+    # Config/environment headers are merged once and sent as client defaults
+    default_headers = merge_headers(cfg, {})
+
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir_bytes = os.path.join(os.fsencode(output_dir), b"")
+
+    jsonl_file = None
+    if output_dir and output_format == "jsonl":
+        jsonl_file = (output_dir / "results.jsonl").open("w", encoding="utf-8")
+
+    status_counts: Counter = Counter()
+
+    async def run_all() -> None:
+        loop = asyncio.get_running_loop()
+        write_tasks: Set[asyncio.Future] = set()
+        # Bounded, so the producer reads the file only slightly ahead of workers
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 4)
+        pending: List[str] = []
+        last_flush = loop.time()
+
+        def report(res: Dict[str, Any]) -> None:
+            # Render at most every 0.1s instead of once per response
+            nonlocal last_flush
+            status_counts[res["status"]] += 1
+            if jsonl_file is not None:
+                # One buffered append stream instead of a file per response
+                jsonl_file.write(json.dumps(res, ensure_ascii=False) + "\n")
+            color = get_status_color(res["status"])
+            pending.append(
+                f"[{color}]{res['status']}[/{color}] {res['elapsed']:.3f}s {res['url']}"
+            )
+            now = loop.time()
+            if now - last_flush >= 0.1:
+                console.print("\n".join(pending))
+                pending.clear()
+                last_flush = now
+
+        limits = httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        )
+        async with httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            limits=limits,
+            headers=default_headers,
+            # Multiplex same-host requests over one connection when possible
+            http2=HTTP2_AVAILABLE and not http1,
+        ) as client:
+
+            async def one(i: int, job: ParallelJob, url: str) -> Dict[str, Any]:
+                if delay:
+                    await asyncio.sleep(delay)
+                req_kw: Dict[str, Any] = {}
+                if job.method in ("POST", "PUT", "PATCH") and job.json_body is not None:
+                    req_kw["json"] = job.json_body
+                t0 = time.perf_counter()
+                r = await client.request(job.method, url, **req_kw)
+                dt = time.perf_counter() - t0
+                res = {
+                    "index": i,
+                    "method": job.method,
+                    "url": url,
+                    "status": r.status_code,
+                    "elapsed": dt,
+                }
+                if jsonl_file is not None:
+                    res["headers"] = dict(r.headers)
+                    res["body"] = r.text
+                elif output_dir:
+                    # Write in a worker thread while other requests are in flight
+                    fut = loop.run_in_executor(
+                        None, _write_result_file, output_dir_bytes, i, r.content
+                    )
+                    write_tasks.add(fut)
+                    fut.add_done_callback(write_tasks.discard)
+                return res
+
+            async def produce() -> None:
+                for i, job in enumerate(iter_jobs(source)):
+                    await queue.put((i, job, resolve(job)))
+                for _ in range(concurrency):
+                    await queue.put(None)
+
+            async def work() -> None:
+                # `concurrency` workers cap the number of requests in flight
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    report(await one(*item))
+
+            try:
+                await asyncio.gather(produce(), *(work() for _ in range(concurrency)))
+            finally:
+                # Show results that arrived before a failure, too
+                if pending:
+                    console.print("\n".join(pending))
+        await asyncio.gather(*write_tasks)
+
+    _use_uvloop()
+    t_start = time.perf_counter()
+    try:
+        asyncio.run(run_all())
+    finally:
+        if jsonl_file is not None:
+            jsonl_file.close()
+        if source is not None:
+            source.close()
+        summary = ", ".join(
+            f"[{color}]{st}[/{color}]: {n}"
+            for st, n in sorted(status_counts.items())
+            for color in (get_status_color(st),)
+        )
+        console.print(
+            f"[bold]{sum(status_counts.values())} requests[/bold]"
+            f" in {time.perf_counter() - t_start:.2f}s"
+            f" [dim]({summary})[/dim]"
+        )
+
+
+def _ws_header_kwargs(version: str, headers: List[tuple[str, str]]) -> Dict[str, Any]:
+    """Pass headers under the name the given websockets version expects."""
+    major = int(version.split(".", 1)[0])
+    # websockets 14 made the new asyncio client the default connect()
+    return {"additional_headers" if major >= 14 else "extra_headers": headers}
+
+
+async def _ws_pump(ws: Any, queue: asyncio.Queue) -> None:
+    """Move incoming frames into queue; None marks the end of the stream."""
+    try:
+        async for msg in ws:
+            await queue.put(msg)
+    finally:
+        await queue.put(None)
+
+
+async def _ws_receive_many(queue: asyncio.Queue, max_n: int) -> List[Any]:
+    """Wait for one frame, then take whatever else is already queued (up to max_n)."""
+    batch = [await queue.get()]
+    while len(batch) < max_n and batch[-1] is not None:
+        try:
+            batch.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return batch
+
+
+def _read_stdin_lines(loop: asyncio.AbstractEventLoop, queue: asyncio.Queue) -> None:
+    """Thread body: hand stdin lines to the event loop; None marks EOF."""
+    try:
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(queue.put_nowait, line.rstrip("\r\n"))
+        loop.call_soon_threadsafe(queue.put_nowait, None)
+    except RuntimeError:
+        pass  # loop already closed
+
+
+async def _ws_send_stdin(ws: Any) -> None:
+    """Send each stdin line as a message; close the connection at EOF."""
+    lines: asyncio.Queue = asyncio.Queue()
+    # One long-lived reader thread instead of an executor job per line
+    threading.Thread(
+        target=_read_stdin_lines, args=(asyncio.get_running_loop(), lines), daemon=True
+    ).start()
+    while True:
+        line = await lines.get()
+        if line is None:
+            break
+        await ws.send(line)
+    await ws.close()
 
 
 @app.command("ws")
@@ -832,6 +1098,35 @@ def ws_cmd(
     url: str = typer.Argument(...),
     send: Optional[str] = typer.Option(None, "--send", help="Send one message and print reply."),
     header: List[str] = typer.Option([], "-H", "--header"),
+    listen: bool = typer.Option(
+        False, "-l", "--listen",
+        help="Print messages until the server closes (Ctrl+C stops).",
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "-o", "--output", help="With --listen, also append messages to this file."
+    ),
+    interactive: bool = typer.Option(
+        False, "-i", "--interactive",
+        help="Send stdin lines as messages while listening.",
+    ),
+    duration: Optional[float] = typer.Option(
+        None, "--duration", help="With --listen, disconnect after this many seconds."
+    ),
+    count: Optional[int] = typer.Option(
+        None, "-n", "--count", help="With --listen, disconnect after this many messages."
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "-q",
+        "--quiet",
+        help="With --output, do not echo messages (default when not on a terminal).",
+    ),
+    timestamps: bool = typer.Option(
+        False, "-t", "--timestamps", help="Prefix listened messages with HH:MM:SS."
+    ),
+    uvloop: bool = typer.Option(
+        True, "--uvloop/--no-uvloop", help="Run on uvloop when it is installed."
+    ),
 ) -> None:
     """Minimal WebSocket client (async)."""
     try:
@@ -840,25 +1135,105 @@ def ws_cmd(
         console.print("[red]websockets package required[/red]")
         raise typer.Exit(1) from exc
 
-    extra: List[tuple[str, str]] = []
-    for h in header:
-        if ":" in h:
-            k, v = h.split(":", 1)
-            extra.append((k.strip(), v.strip()))
+    if duration is not None and duration <= 0:
+        console.print("[red]--duration must be positive[/red]")
+        raise typer.Exit(2)
+    if count is not None and count < 1:
+        console.print("[red]--count must be at least 1[/red]")
+        raise typer.Exit(2)
+
+    try:
+        extra = list(parse_header_pairs(header).items())
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(2) from exc
+    connect_kwargs = _ws_header_kwargs(websockets.__version__, extra)
+    # Rendering every frame through Rich is the bottleneck when only the file matters
+    echo = output is None or (console.is_terminal and not quiet)
 
     async def run() -> None:
-        async with websockets.connect(url, extra_headers=extra) as ws:
+        async with websockets.connect(url, **connect_kwargs) as ws:
             if send:
                 await ws.send(send)
+            if not (listen or interactive):
+                if not send:
+                    console.print(
+                        "[dim]Connected. Receiving one message (15s timeout)…[/dim]"
+                    )
                 msg = await asyncio.wait_for(ws.recv(), timeout=15.0)
                 console.print(str(msg))
-            else:
-                console.print("[dim]Connected. Receiving one message (15s timeout)…[/dim]")
-                msg = await asyncio.wait_for(ws.recv(), timeout=15.0)
-                console.print(str(msg))
-
+                return
+
+            console.print("[dim]Connected. Listening (Ctrl+C to stop)…[/dim]")
+            queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+            reader = asyncio.ensure_future(_ws_pump(ws, queue))
+            sender = asyncio.ensure_future(_ws_send_stdin(ws)) if interactive else None
+            loop = asyncio.get_running_loop()
+            closing: List[asyncio.Future] = []
+
+            def close_soon() -> None:
+                # Closing ends the reader, which ends the loop below; frames that
+                # arrive during the handshake are still drained, then dropped
+                if not closing:
+                    closing.append(asyncio.ensure_future(ws.close()))
+
+            # One timer for the whole session instead of a timeout per receive
+            deadline = (
+                loop.call_later(duration, close_soon) if duration is not None else None
+            )
+            received = 0
+            with contextlib.ExitStack() as stack:
+                output_file = (
+                    stack.enter_context(open(output, "a", encoding="utf-8"))
+                    if output else None
+                )
+                last_flush = loop.time()
+                last_sec, stamp, stamp_text = -1, "", Text()
+                while True:
+                    # Drain bursts in one go: one wakeup and one render per batch
+                    batch = await _ws_receive_many(queue, 128)
+                    lines = [str(m) for m in batch if m is not None]
+                    if count is not None:
+                        lines = lines[: count - received]
+                        received += len(lines)
+                        if received >= count:
+                            close_soon()
+                    if timestamps and lines:
+                        # strftime and the styled prefix only when the second changes
+                        sec = int(time.time())
+                        if sec != last_sec:
+                            last_sec = sec
+                            stamp = time.strftime("[%H:%M:%S] ", time.localtime(sec))
+                            stamp_text = Text(stamp, style="dim")
+                    if lines and echo:
+                        # Prebuilt Text objects: Rich never runs its markup parser here
+                        if timestamps:
+                            console.print(
+                                Text("\n").join(stamp_text + line for line in lines)
+                            )
+                        else:
+                            console.print(Text("\n".join(lines)))
+                    if lines and output_file is not None:
+                        # One write per batch; flush at most every 200ms
+                        output_file.write("".join(f"{stamp}{line}\n" for line in lines))
+                        now = loop.time()
+                        if now - last_flush >= 0.2:
+                            output_file.flush()
+                            last_flush = now
+                    if batch[-1] is None:
+                        break
+            if deadline is not None:
+                deadline.cancel()
+            if sender is not None and not sender.done():
+                sender.cancel()
+            await reader
+
+    if uvloop:
+        _use_uvloop()
     try:
         asyncio.run(run())
+    except KeyboardInterrupt:
+        raise typer.Exit(0) from None
     except Exception as exc:
         console.print(f"[red]{exc}[/red]")
         raise typer.Exit(1) from exc
@@ -12,6 +12,8 @@ from talkie.cli.execute import parse_httpie_items
 _METHODS = frozenset(
     ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
 )
+# Without these, shlex.split() is equivalent to str.split()
+_SHELL_SPECIAL = frozenset("'\"\\")
 
 
 @dataclass
@@ -33,10 +35,13 @@ def parse_parallel_line(line: str) -> ParallelJob:
     raw = line.strip()
     if not raw or raw.startswith("#"):
         raise ValueError("empty or comment")
-    try:
-        parts = shlex.split(raw, posix=os.name != "nt")
-    except ValueError:
+    if _SHELL_SPECIAL.isdisjoint(raw):
         parts = raw.split()
+    else:
+        try:
+            parts = shlex.split(raw, posix=os.name != "nt")
+        except ValueError:
+            parts = raw.split()
 
     idx = 0
     method = "GET"
@@ -1,13 +1,47 @@
-"""Core modules for Talkie HTTP client."""
+"""Core modules for Talkie HTTP client.
+
+Submodules are imported on first attribute access, so the CLI importing
+``talkie.core.client`` does not also load the WebSocket client.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import HttpClient, get_shared_client
+    from .async_client import AsyncHttpClient
+    from .request_builder import RequestBuilder
+    from .response_formatter import ResponseFormatter
+    from .websocket_client import WebSocketClient, WebSocketMessage
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "HttpClient": ".client",
+    "get_shared_client": ".client",
+    "AsyncHttpClient": ".async_client",
+    "RequestBuilder": ".request_builder",
+    "ResponseFormatter": ".response_formatter",
+    "WebSocketClient": ".websocket_client",
+    "WebSocketMessage": ".websocket_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
 
-from .client import HttpClient
-from .async_client import AsyncHttpClient
-from .request_builder import RequestBuilder
-from .response_formatter import ResponseFormatter
-from .websocket_client import WebSocketClient, WebSocketMessage
 
 __all__ = [
     "HttpClient",
+    "get_shared_client",
     "AsyncHttpClient",
     "RequestBuilder",
     "ResponseFormatter",
@@ -1,34 +1,82 @@
 """Async HTTP client for Talkie."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import httpx
 
+from .client import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP2_AVAILABLE,
+    as_timeout,
+)
+
 
 class AsyncHttpClient:
-    """Async HTTP client."""
+    """Async HTTP client.
+
+    Mirrors HttpClient for concurrent use: one pooled httpx.AsyncClient
+    serves any number of in-flight requests, e.g.
+    ``await asyncio.gather(*(client.get(u) for u in urls))``.
+    """
 
-    def __init__(self):
+    def __init__(self, http2: bool = True, limits: Optional[httpx.Limits] = None):
+        """Initialize client settings.
+
+        Args:
+            http2: Negotiate HTTP/2 so concurrent requests to one host share a
+                connection; ignored unless the ``h2`` package is installed
+            limits: Connection pool limits; defaults to HttpClient's ceilings
+                and keep-alive expiry
+        """
         self.client: Optional[httpx.AsyncClient] = None
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._limits = limits or httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        )
 
     async def __aenter__(self):
         """Enter async context manager."""
-        self.client = httpx.AsyncClient()
+        self.client = httpx.AsyncClient(http2=self.http2, limits=self._limits)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context manager."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying client and its connection pool."""
         if self.client:
             await self.client.aclose()
             self.client = None
 
-    async def request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
-        """Make async HTTP request."""
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Union[float, httpx.Timeout]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Make async HTTP request; ``timeout`` applies to this call only."""
         if not self.client:
             raise RuntimeError("Client not initialized")
 
+        if timeout is not None:
+            kwargs["timeout"] = as_timeout(timeout)
+
         response = await self.client.request(method, url, **kwargs)
         return {
             "status": response.status_code,
             "headers": dict(response.headers),
             "body": response.text
         }
+
+    async def get(self, url: str, **kwargs: Any) -> Dict[str, Any]:
+        """Make async GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Dict[str, Any]:
+        """Make async POST request."""
+        return await self.request("POST", url, **kwargs)
@@ -1,9 +1,71 @@
 """HTTP client for Talkie."""
 
+import atexit
+import functools
+import importlib.util
+import threading
 from typing import Any, Dict, Optional, Union
 
 import httpx
 
+# httpx only speaks HTTP/2 with the optional h2 package installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Pool ceilings: high enough that bursts of requests queue on the server, not the pool
+DEFAULT_MAX_CONNECTIONS = 1000
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+# Seconds an idle pooled connection is kept for reuse
+DEFAULT_KEEPALIVE_EXPIRY = 15.0
+
+# Process-wide pooled clients keyed by certificate verification, see get_shared_client()
+_shared_clients: Dict[bool, httpx.Client] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(verify: bool = True) -> httpx.Client:
+    """Get the process-wide httpx client for a TLS verification mode.
+
+    Requests sent through it reuse keep-alive connections, so back-to-back
+    calls to the same host skip the TCP and TLS handshakes. Timeout and
+    redirect handling are passed per request.
+
+    Args:
+        verify: Verify TLS certificates; each mode has its own pool
+
+    Returns:
+        httpx.Client: Shared client, closed at interpreter exit
+    """
+    client = _shared_clients.get(verify)
+    if client is None:
+        # Threads racing on first use must not each build (and leak) a pool
+        with _shared_clients_lock:
+            client = _shared_clients.get(verify)
+            if client is None:
+                client = httpx.Client(
+                    verify=verify,
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(
+                        max_connections=DEFAULT_MAX_CONNECTIONS,
+                        max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+                    ),
+                )
+                _shared_clients[verify] = client
+                atexit.register(client.close)
+    return client
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_timeout(seconds: Optional[float]) -> httpx.Timeout:
+    return httpx.Timeout(seconds)
+
+
+def as_timeout(timeout: Union[None, float, httpx.Timeout]) -> httpx.Timeout:
+    """Return an httpx.Timeout, reusing one instance per distinct number of seconds."""
+    if isinstance(timeout, httpx.Timeout):
+        return timeout
+    return _cached_timeout(timeout)
+
 
 class HttpClient:
     """Synchronous HTTP client wrapping httpx."""
@@ -13,30 +75,80 @@ class HttpClient:
         timeout: Union[float, httpx.Timeout] = 30.0,
         follow_redirects: bool = True,
         verify: bool = True,
+        client: Optional[httpx.Client] = None,
+        http2: bool = True,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     ) -> None:
-        self._timeout = timeout
+        """Initialize client settings.
+
+        Args:
+            timeout: Request timeout in seconds
+            follow_redirects: Follow HTTP redirects
+            verify: Verify TLS certificates
+            client: Existing httpx client to send requests through (e.g.
+                get_shared_client()); it is left open on exit
+            http2: Negotiate HTTP/2 for the client created on enter; ignored
+                unless the ``h2`` package is installed
+            keepalive_expiry: Seconds an idle connection stays pooled. httpx
+                defaults to 5s, which drops the connection between polls made
+                every 10-15s and forces a new TCP/TLS handshake each time.
+            max_connections: Pool ceiling for concurrent connections (None = no limit)
+            max_keepalive_connections: Idle connections kept for reuse (None = no limit)
+        """
+        self._timeout = as_timeout(timeout)
         self._follow_redirects = follow_redirects
         self._verify = verify
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._external_client = client
         self.client: Optional[httpx.Client] = None
 
     def __enter__(self) -> "HttpClient":
-        self.client = httpx.Client(
-            timeout=self._timeout,
-            follow_redirects=self._follow_redirects,
-            verify=self._verify,
-        )
+        if self._external_client is not None:
+            self.client = self._external_client
+        else:
+            self.client = httpx.Client(
+                timeout=self._timeout,
+                follow_redirects=self._follow_redirects,
+                verify=self._verify,
+                http2=self.http2,
+                limits=self._limits,
+            )
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         if self.client:
-            self.client.close()
+            if self.client is not self._external_client:
+                self.client.close()
             self.client = None
 
-    def request(self, method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
-        """Make HTTP request; returns status, headers, body, elapsed_seconds."""
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Union[float, httpx.Timeout]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Make HTTP request; returns status, headers, body, elapsed_seconds.
+
+        ``timeout`` overrides the client's timeout for this call only; it is
+        passed to httpx per request, so the (possibly shared) client is never
+        mutated.
+        """
         if not self.client:
             raise RuntimeError("Client not initialized; use 'with HttpClient() as client:'")
 
+        if timeout is not None:
+            kwargs["timeout"] = as_timeout(timeout)
+        if self.client is self._external_client:
+            kwargs.setdefault("timeout", self._timeout)
+            kwargs.setdefault("follow_redirects", self._follow_redirects)
         response = self.client.request(method, url, **kwargs)
         elapsed = getattr(response, "elapsed", None)
         elapsed_s = elapsed.total_seconds() if elapsed is not None else None
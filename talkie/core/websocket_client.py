@@ -1,6 +1,22 @@
 """WebSocket client for real-time communication."""
 
-from typing import Any, Optional, Callable
+import json
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from websockets.asyncio.client import ClientConnection
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+FRAMINGS = ("json", "msgpack")
 
 
 class WebSocketMessage:
@@ -13,44 +29,111 @@ class WebSocketMessage:
 
 
 class WebSocketClient:
-    """WebSocket client."""
+    """WebSocket client.
 
-    def __init__(self, uri: str):
+    Structured payloads (anything that is not ``str``/``bytes``) are encoded
+    with the chosen framing: ``json`` sends text frames (orjson when
+    installed), ``msgpack`` sends smaller binary frames. Received frames are
+    decoded the same way; frames that do not decode are returned as-is.
+    """
+
+    def __init__(self, uri: str, framing: str = "json", max_size: int = 2**20):
+        """
+        Initialize WebSocket client.
+
+        Args:
+            uri: Server URI (ws:// or wss://)
+            framing: Payload encoding, "json" or "msgpack"
+            max_size: Largest incoming frame in bytes
+
+        Raises:
+            ValueError: Unknown framing, or msgpack framing without msgpack installed
+        """
+        if framing not in FRAMINGS:
+            raise ValueError(f"framing must be one of {', '.join(FRAMINGS)}")
+        if framing == "msgpack" and msgpack is None:
+            raise ValueError("msgpack framing requires the msgpack package")
         self.uri = uri
-        self.connection = None
+        self.framing = framing
+        self.max_size = max_size
+        self.connection: Optional["ClientConnection"] = None
         self.is_connected = False
-        self._handlers = {}
+        self._handlers: Dict[str, List[Callable]] = {}
+        # Immutable per-event snapshots read on every received message
+        self._frozen_handlers: Dict[str, Tuple[Callable, ...]] = {}
 
     async def connect(self) -> bool:
         """Connect to WebSocket server."""
+        import websockets
+
         try:
-            # Mock connection for now
-            self.is_connected = True
-            return True
-        except (ConnectionError, OSError) as e:
+            # Per-message deflate costs more CPU than it saves on small frames
+            self.connection = await websockets.connect(
+                self.uri, max_size=self.max_size, compression=None, ping_interval=20
+            )
+        except (OSError, websockets.exceptions.WebSocketException) as e:
             print(f"Connection failed: {e}")
             return False
+        self.is_connected = True
+        return True
 
     async def disconnect(self) -> None:
         """Disconnect from WebSocket server."""
+        if self.connection is not None:
+            await self.connection.close()
+            self.connection = None
         self.is_connected = False
 
-    async def send(self, message: str) -> bool:
-        """Send message."""
-        if not self.is_connected:
+    def _encode(self, message: Any) -> Union[str, bytes]:
+        if isinstance(message, (str, bytes)):
+            return message
+        if self.framing == "msgpack":
+            packed: bytes = msgpack.packb(message)
+            return packed
+        if orjson is not None:
+            return orjson.dumps(message).decode("utf-8")
+        return json.dumps(message, separators=(",", ":"))
+
+    def _decode(self, frame: Union[str, bytes]) -> WebSocketMessage:
+        try:
+            if self.framing == "msgpack" and isinstance(frame, bytes):
+                return WebSocketMessage("msgpack", msgpack.unpackb(frame, raw=False))
+            if self.framing == "json" and isinstance(frame, str):
+                data = orjson.loads(frame) if orjson is not None else json.loads(frame)
+                return WebSocketMessage("json", data)
+        except ValueError:
+            pass
+        return WebSocketMessage("text" if isinstance(frame, str) else "binary", frame)
+
+    async def send(self, message: Any) -> bool:
+        """Send message; str and bytes go out unchanged, other values are framed."""
+        if not self.is_connected or self.connection is None:
             return False
-        # Mock send
+        await self.connection.send(self._encode(message))
         return True
 
     async def receive(self) -> Optional[WebSocketMessage]:
-        """Receive message."""
-        if not self.is_connected:
+        """Receive the next message and pass it to "message" handlers.
+
+        Returns None when not connected or once the server has closed the
+        connection; the client is then marked disconnected.
+        """
+        if not self.is_connected or self.connection is None:
+            return None
+        from websockets.exceptions import ConnectionClosed
+
+        try:
+            frame = await self.connection.recv()
+        except ConnectionClosed:
+            self.is_connected = False
             return None
-        # Mock receive
-        return WebSocketMessage("text", "mock message")
+        message = self._decode(frame)
+        for handler in self._frozen_handlers.get("message", ()):
+            handler(message)
+        return message
 
     def on(self, event: str, handler: Callable) -> None:
-        """Register event handler."""
-        if event not in self._handlers:
-            self._handlers[event] = []
-        self._handlers[event].append(handler)
+        """Register event handler; safe to call while connected."""
+        handlers = self._handlers.setdefault(event, [])
+        handlers.append(handler)
+        self._frozen_handlers[event] = tuple(handlers)
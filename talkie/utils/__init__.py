@@ -1,23 +1,73 @@
-"""Utility modules for Talkie."""
-
-from .config import Config, Environment
-from .formatter import (
-    DataFormatter, format_json, format_xml, format_html
-)
-from .colors import get_status_color, get_content_type_color
-from .cache import ResponseCache, CacheConfig, CacheEntry
-from .logger import Logger
-from .error_handler import ErrorHandler
-from .validators import validate_url, validate_json
-from .memory_manager import MemoryManager
-from .performance_config import PerformanceConfig
-# from .benchmarks import benchmark_request, benchmark_requests
-# Functions not implemented yet
-from .curl_generator import generate_curl_command
-from .graphql import GraphQLClient, GraphQLResponse
-from .history import HistoryManager
-from .openapi import OpenAPIClient
-from .openapi_generator import OpenApiClientGenerator
+"""Utility modules for Talkie.
+
+Submodules are imported on first attribute access, so ``import
+talkie.utils.config`` does not drag in YAML, OpenAPI or cache support.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import Config, Environment
+    from .formatter import (
+        DataFormatter, format_json, format_xml, format_html
+    )
+    from .colors import get_status_color, get_content_type_color
+    from .cache import ResponseCache, CacheConfig, CacheEntry
+    from .logger import Logger
+    from .error_handler import ErrorHandler
+    from .validators import validate_url, validate_json
+    from .memory_manager import MemoryManager
+    from .performance_config import PerformanceConfig
+    from .curl_generator import generate_curl_command
+    from .graphql import GraphQLClient, GraphQLResponse
+    from .history import HistoryManager
+    from .openapi import OpenAPIClient
+    from .openapi_generator import OpenApiClientGenerator
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "Config": ".config",
+    "Environment": ".config",
+    "DataFormatter": ".formatter",
+    "format_json": ".formatter",
+    "format_xml": ".formatter",
+    "format_html": ".formatter",
+    "get_status_color": ".colors",
+    "get_content_type_color": ".colors",
+    "ResponseCache": ".cache",
+    "CacheConfig": ".cache",
+    "CacheEntry": ".cache",
+    "Logger": ".logger",
+    "ErrorHandler": ".error_handler",
+    "validate_url": ".validators",
+    "validate_json": ".validators",
+    "MemoryManager": ".memory_manager",
+    "PerformanceConfig": ".performance_config",
+    # "benchmark_request": ".benchmarks",
+    # "benchmark_requests": ".benchmarks",
+    # Functions not implemented yet
+    "generate_curl_command": ".curl_generator",
+    "GraphQLClient": ".graphql",
+    "GraphQLResponse": ".graphql",
+    "HistoryManager": ".history",
+    "OpenAPIClient": ".openapi",
+    "OpenApiClientGenerator": ".openapi_generator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Config",
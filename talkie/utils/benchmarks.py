@@ -10,6 +10,8 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 import json
 
+import httpx
+
 try:
     import psutil
 except ImportError:
@@ -234,21 +236,27 @@ class BenchmarkRunner:
                 errors.append(str(e))
                 return False
 
-        # Create async client
-        client = AsyncHttpClient(max_concurrent=concurrent_requests)
-
-        # Execute all requests concurrently
-        semaphore = asyncio.Semaphore(concurrent_requests)
+        limits = httpx.Limits(
+            max_connections=concurrent_requests,
+            max_keepalive_connections=concurrent_requests,
+        )
+        url_iter = iter(urls)
 
-        async def bounded_request(url: str) -> bool:
-            async with semaphore:
-                return await make_async_request(client, url)
+        async def worker(client: AsyncHttpClient) -> int:
+            # Workers pull from one shared iterator: no per-URL task or slice copy
+            ok = 0
+            for url in url_iter:
+                if await make_async_request(client, url):
+                    ok += 1
+            return ok
 
-        tasks = [bounded_request(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async with AsyncHttpClient(limits=limits) as client:
+            counts = await asyncio.gather(
+                *(worker(client) for _ in range(concurrent_requests))
+            )
 
         # Count successful requests
-        successful_requests = sum(1 for r in results if r is True)
+        successful_requests = sum(counts)
 
         # Calculate metrics
         end_time = time.time()
@@ -441,7 +449,8 @@ class BenchmarkRunner:
         )
 
         # Async benchmark
-        urls = [f"{test_url}?id={i}" for i in range(100)]
+        prefix = f"{test_url}?id="
+        urls = [prefix + str(i) for i in range(100)]
         async_result = asyncio.run(self.run_async_benchmark(urls, 20))
         results.append(async_result)
 
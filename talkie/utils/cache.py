@@ -4,13 +4,20 @@ import os
 import json
 import hashlib
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
 from pathlib import Path
 from dataclasses import dataclass, asdict
 
 import httpx
 from pydantic import BaseModel, Field
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 
 @dataclass
 class CacheEntry:
@@ -75,6 +82,47 @@ class CacheConfig(BaseModel):
     cache_graphql: bool = Field(True, description="Cache GraphQL queries (only queries, not mutations)")
 
 
+def _response_ttl(headers: Mapping[str, str]) -> Optional[int]:
+    """
+    Derive a TTL from the server's Cache-Control, Pragma or Expires header.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        TTL in seconds (0 means do not store), or None if the server gave no directive
+    """
+    cache_control = headers.get("cache-control")
+    if cache_control:
+        max_age = None
+        for directive in cache_control.lower().split(","):
+            name, _, value = directive.strip().partition("=")
+            # no-cache requires revalidation, which this cache cannot do;
+            # either wins over a max-age in the same header
+            if name in ("no-store", "no-cache"):
+                return 0
+            if name == "max-age" and max_age is None:
+                try:
+                    max_age = max(0, int(value.strip().strip('"')))
+                except ValueError:
+                    max_age = 0
+        if max_age is not None:
+            return max_age
+    elif "no-cache" in headers.get("pragma", "").lower():
+        # HTTP/1.0 servers; Cache-Control takes precedence when present
+        return 0
+
+    expires = headers.get("expires")
+    if expires:
+        try:
+            return max(0, int(parsedate_to_datetime(expires).timestamp() - time.time()))
+        except (TypeError, ValueError, IndexError):
+            # Invalid dates such as "0" mean "already expired"
+            return 0
+
+    return None
+
+
 class ResponseCache:
     """HTTP response cache manager."""
 
@@ -93,16 +141,13 @@ class ResponseCache:
         self.index_file = self.cache_dir / "index.json"
         self.index = self._load_index()
 
-    def _load_index(self) -> Dict[str, Dict[str, Any]]:
-        """Load cache index from disk."""
-        if not self.index_file.exists():
-            return {}
-
+    def _load_index(self) -> "OrderedDict[str, Dict[str, Any]]":
+        """Load cache index from disk, least recently used entry first."""
         try:
             with open(self.index_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                return OrderedDict(json.load(f))
         except (json.JSONDecodeError, IOError):
-            return {}
+            return OrderedDict()
 
     def _save_index(self) -> None:
         """Save cache index to disk."""
@@ -140,9 +185,20 @@ class ResponseCache:
             'body': key_data.body or ''
         }
 
-        # Generate hash
-        key_string = json.dumps(key_components, sort_keys=True, ensure_ascii=False)
-        return hashlib.md5(key_string.encode('utf-8')).hexdigest()
+        # Hash the canonical (key-sorted) JSON bytes. Always the stdlib encoder:
+        # orjson formats some floats differently, so keys would depend on
+        # whether it happens to be installed
+        key_bytes = json.dumps(
+            key_components,
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(',', ':'),
+        ).encode('utf-8')
+        # xxh3 keys are prefixed so they never collide with (or shadow)
+        # blake2b entries written by an install without xxhash
+        if xxhash is not None:
+            return f"x3{xxhash.xxh3_128_hexdigest(key_bytes)}"
+        return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
 
     def _should_cache_request(
         self,
@@ -218,13 +274,6 @@ class ResponseCache:
         entry_info = self.index[cache_key]
         cache_file = self.cache_dir / f"{cache_key}.json"
 
-        # Check if cache file exists
-        if not cache_file.exists():
-            # Remove from index if file is missing
-            del self.index[cache_key]
-            self._save_index()
-            return None
-
         try:
             # Load cache entry
             with open(cache_file, 'r', encoding='utf-8') as f:
@@ -248,6 +297,8 @@ class ResponseCache:
                 request=httpx.Request(method, url)
             )
 
+            # Recency is persisted with the next index write
+            self.index.move_to_end(cache_key)
             return response
 
         except (json.JSONDecodeError, IOError, KeyError):
@@ -269,18 +320,36 @@ class ResponseCache:
 
         Args:
             response: HTTP response to cache
-            ttl: Time to live in seconds (uses default if None)
+            ttl: Time to live in seconds (if None, taken from the response's
+                Cache-Control/Expires headers, else the configured default)
             max_size_mb: Maximum response size to cache in MB
         """
-        # Skip caching if response is too large
-        response_size_mb = len(response.content) / (1024 * 1024)
-        if response_size_mb > max_size_mb:
-            return
         request = response.request
         method = request.method
-        url = str(request.url)
         headers = dict(request.headers)
 
+        # Only POST (GraphQL queries) needs the body to decide; settle the
+        # rest before touching the response or request bodies
+        needs_body = method.upper() == 'POST'
+        if not needs_body and not self._should_cache_request(method, headers):
+            return
+
+        # Skip caching if response is too large. Content-Length is the size on
+        # the wire, so it is trusted (and the body left unread) only when no
+        # content coding was applied
+        response_size = None
+        content_encoding = response.headers.get('content-encoding', 'identity')
+        if content_encoding.strip().lower() == 'identity':
+            try:
+                response_size = int(response.headers['content-length'])
+            except (KeyError, ValueError):
+                pass
+        if response_size is None:
+            response_size = len(response.content)
+        if response_size > max_size_mb * 1024 * 1024:
+            return
+        url = str(request.url)
+
         # Extract params and body
         params = dict(request.url.params) if request.url.params else None
         body = None
@@ -289,10 +358,14 @@ class ResponseCache:
         elif hasattr(request, '_content') and request._content:
             body = request._content.decode('utf-8')
 
-        if not self._should_cache_request(method, headers, body):
+        if needs_body and not self._should_cache_request(method, headers, body):
             return
 
-        # Use provided TTL or default
+        # Explicit TTL, then the server's caching directives, then the default
+        if ttl is None:
+            ttl = _response_ttl(response.headers)
+            if ttl == 0:
+                return
         ttl = ttl or self.config.default_ttl
 
         # Create cache entry
@@ -327,6 +400,7 @@ class ResponseCache:
                 'expires_at': entry.expires_at,
                 'size': cache_file.stat().st_size
             }
+            self.index.move_to_end(cache_key)
 
             # Cleanup if needed
             self._cleanup_cache()
@@ -350,39 +424,19 @@ class ResponseCache:
             cache_file.unlink(missing_ok=True)
             del self.index[key]
 
-        # Enforce max entries limit
-        if len(self.index) > self.config.max_entries:
-            # Sort by access time, remove oldest
-            sorted_entries = sorted(
-                self.index.items(),
-                key=lambda x: x[1]['cached_at']
-            )
-
-            entries_to_remove = len(self.index) - self.config.max_entries
-            for key, _ in sorted_entries[:entries_to_remove]:
-                cache_file = self.cache_dir / f"{key}.json"
-                cache_file.unlink(missing_ok=True)
-                del self.index[key]
+        # The index is kept in LRU order, so eviction pops from the front
+        while len(self.index) > self.config.max_entries:
+            key, _ = self.index.popitem(last=False)
+            (self.cache_dir / f"{key}.json").unlink(missing_ok=True)
 
         # Check total cache size
         total_size = sum(entry['size'] for entry in self.index.values())
         max_size_bytes = self.config.max_size_mb * 1024 * 1024
 
-        if total_size > max_size_bytes:
-            # Remove oldest entries until under size limit
-            sorted_entries = sorted(
-                self.index.items(),
-                key=lambda x: x[1]['cached_at']
-            )
-
-            for key, entry_info in sorted_entries:
-                cache_file = self.cache_dir / f"{key}.json"
-                cache_file.unlink(missing_ok=True)
-                total_size -= entry_info['size']
-                del self.index[key]
-
-                if total_size <= max_size_bytes:
-                    break
+        while self.index and total_size > max_size_bytes:
+            key, entry_info = self.index.popitem(last=False)
+            (self.cache_dir / f"{key}.json").unlink(missing_ok=True)
+            total_size -= entry_info['size']
 
     def clear_cache(self) -> None:
         """Clear all cached entries."""
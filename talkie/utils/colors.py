@@ -76,6 +76,9 @@ STATUS_COLORS = {
     511: "magenta",
 }
 
+# Цвета по классу статуса (status_code // 100) для кодов вне STATUS_COLORS
+STATUS_CLASS_COLORS = {1: "blue", 2: "green", 3: "yellow", 4: "red", 5: "magenta"}
+
 # Цвета для различных типов содержимого
 CONTENT_TYPE_COLORS = {
     "application/json": "green",
@@ -100,7 +103,10 @@ def get_status_color(status_code: int) -> str:
     Returns:
         str: Название цвета для Rich
     """
-    return STATUS_COLORS.get(status_code, "white")
+    color = STATUS_COLORS.get(status_code)
+    if color is None:
+        color = STATUS_CLASS_COLORS.get(status_code // 100, "white")
+    return color
 
 
 def get_content_type_color(content_type: str) -> str:
@@ -2,14 +2,32 @@
 
 import os
 import json
+import functools
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
 
 from talkie.__version__ import __version__
 
 
+@functools.lru_cache(maxsize=4)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file once per (mtime, size), so unchanged files are reused.
+
+    Args:
+        path: Config file path
+        mtime_ns: File modification time, part of the cache key
+        size: File size, part of the cache key
+
+    Returns:
+        Dict[str, Any]: parsed JSON data (do not mutate)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data: Dict[str, Any] = json.load(f)
+    return data
+
+
 class Environment(BaseModel):
     """Модель для описания окружения."""
 
@@ -45,13 +63,17 @@ class Config(BaseModel):
         """
         config_path = cls._get_config_path()
 
-        if not config_path.exists():
+        # One stat answers both "does it exist" and the cache key below
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
             # Create default configuration
             return cls._create_default_config()
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            config_data = _read_config_file(
+                str(config_path), st.st_mtime_ns, st.st_size
+            )
 
             return cls(**config_data)
         except (FileNotFoundError, json.JSONDecodeError, ValueError):
@@ -1,9 +1,14 @@
 """Enhanced error handling and validation utilities."""
 
+import time
 import traceback
+import urllib.parse
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 from dataclasses import dataclass
 from enum import Enum
+
+import httpx
+
 from ..utils.logger import Logger
 
 logger = Logger()
@@ -41,7 +46,6 @@ class ErrorInfo:
     max_retries: int = 3
 
     def __post_init__(self):
-        import time
         if self.timestamp == 0.0:
             self.timestamp = time.time()
         if self.stack_trace is None and self.exception:
@@ -108,31 +112,27 @@ class ErrorHandler:
     def _setup_default_retry_strategies(self) -> None:
         """Setup default retry strategies."""
         # HTTP timeout errors - retry
-        try:
-            import httpx
-            self.add_retry_strategy(
-                httpx.TimeoutException,
-                lambda e: e.retry_count < 2
-            )
+        self.add_retry_strategy(
+            httpx.TimeoutException,
+            lambda e: e.retry_count < 2
+        )
 
-            # HTTP connection errors - retry
-            self.add_retry_strategy(
-                httpx.ConnectError,
-                lambda e: e.retry_count < 3
-            )
+        # HTTP connection errors - retry
+        self.add_retry_strategy(
+            httpx.ConnectError,
+            lambda e: e.retry_count < 3
+        )
 
-            # HTTP status errors - retry for 5xx
-            self.add_retry_strategy(
-                httpx.HTTPStatusError,
-                lambda e: (
-                    e.exception and
-                    hasattr(e.exception, 'response') and
-                    e.exception.response.status_code >= 500 and
-                    e.retry_count < 2
-                )
+        # HTTP status errors - retry for 5xx
+        self.add_retry_strategy(
+            httpx.HTTPStatusError,
+            lambda e: (
+                e.exception and
+                hasattr(e.exception, 'response') and
+                e.exception.response.status_code >= 500 and
+                e.retry_count < 2
             )
-        except ImportError:
-            pass  # httpx not available
+        )
 
     def _default_retry_logic(self, error_info: ErrorInfo) -> bool:
         """Default retry logic."""
@@ -196,7 +196,6 @@ def validate_url(url: str) -> None:
 
     # Basic URL validation
     try:
-        import urllib.parse
         parsed = urllib.parse.urlparse(url)
         if not parsed.netloc:
             raise ValidationError("Invalid URL format")
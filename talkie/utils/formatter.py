@@ -1,5 +1,6 @@
 """Module for auto-formatting various data types."""
 
+import functools
 import json
 import re
 from typing import Any, Dict, Optional, Union
@@ -8,7 +9,68 @@ import html2text
 import xmltodict
 from pygments import formatters, highlight, lexers
 from rich.console import Console
-from rich.syntax import Syntax
+from rich.syntax import Syntax, SyntaxTheme
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=None)
+def get_syntax_theme(name: str = "monokai") -> SyntaxTheme:
+    """Get a Rich syntax theme, loading its Pygments style only once.
+
+    Args:
+        name: Pygments style or Rich theme name
+
+    Returns:
+        SyntaxTheme: Theme to pass as ``Syntax(..., theme=...)``
+    """
+    return Syntax.get_theme(name)
+
+
+def dump_json(data: Any, sort_keys: bool = False) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON-compatible object
+        sort_keys: Sort object keys
+
+    Returns:
+        str: JSON text with 2-space indentation and non-ASCII kept as is
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, option=option).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib handles those
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+
+
+def load_json(text: str) -> Any:
+    """Parse JSON text, using orjson when it is installed.
+
+    Args:
+        text: JSON document
+
+    Returns:
+        Any: Parsed value
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity, which the stdlib accepts; it also raises the error
+            pass
+    return json.loads(text)
 
 
 class DataFormatter:
@@ -41,7 +103,7 @@ class DataFormatter:
         # Convert string to dictionary
         if isinstance(data, str):
             try:
-                json_obj = json.loads(data)
+                json_obj = load_json(data)
             except json.JSONDecodeError:
                 # If parsing fails, return original string
                 return data
@@ -49,9 +111,7 @@ class DataFormatter:
             json_obj = data
 
         # Format JSON with indentation
-        formatted_json = json.dumps(
-            json_obj, indent=2, ensure_ascii=False, sort_keys=True
-        )
+        formatted_json = dump_json(json_obj, sort_keys=True)
 
         # Syntax highlighting
         if colorize:
@@ -170,11 +230,11 @@ class DataFormatter:
         if is_json or has_json_structure:
             # JSON
             try:
-                json_obj = json.loads(data)
+                json_obj = load_json(data)
                 syntax = Syntax(
-                    json.dumps(json_obj, indent=2, ensure_ascii=False, sort_keys=True),
+                    dump_json(json_obj, sort_keys=True),
                     "json",
-                    theme="monokai",
+                    theme=get_syntax_theme(),
                     word_wrap=True,
                 )
                 self.console.print(syntax)
@@ -188,7 +248,9 @@ class DataFormatter:
             # XML
             try:
                 formatted_xml = self.format_xml(data, colorize=False)
-                syntax = Syntax(formatted_xml, "xml", theme="monokai", word_wrap=True)
+                syntax = Syntax(
+                    formatted_xml, "xml", theme=get_syntax_theme(), word_wrap=True
+                )
                 self.console.print(syntax)
             except Exception:
                 self.console.print(data)
@@ -197,7 +259,9 @@ class DataFormatter:
             # HTML
             try:
                 formatted_html = self._format_html_tags(data)
-                syntax = Syntax(formatted_html, "html", theme="monokai", word_wrap=True)
+                syntax = Syntax(
+                    formatted_html, "html", theme=get_syntax_theme(), word_wrap=True
+                )
                 self.console.print(syntax)
             except Exception:
                 self.console.print(data)
@@ -277,11 +341,9 @@ class DataFormatter:
         """
         if colorize:
             try:
-                from pygments import highlight as pygments_highlight
-                from pygments.lexers import SqlLexer
-                from pygments.formatters import TerminalFormatter
-
-                return pygments_highlight(data, SqlLexer(), TerminalFormatter())
+                return highlight(
+                    data, lexers.SqlLexer(), formatters.TerminalFormatter()
+                )
             except Exception:
                 pass
 
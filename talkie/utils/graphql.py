@@ -4,7 +4,36 @@ import json
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
-import httpx
+from talkie.core.client import get_shared_client
+
+
+INPUT_VALUE_FRAGMENT = """
+    fragment InputValue on __InputValue {
+        name
+        description
+        type {
+            name
+            kind
+            ofType {
+                name
+                kind
+            }
+        }
+        defaultValue
+    }
+    """
+
+TYPE_REF_FRAGMENT = """
+    fragment TypeRef on __Type {
+        name
+        kind
+        description
+        ofType {
+            name
+            kind
+        }
+    }
+    """
 
 
 @dataclass
@@ -56,10 +85,17 @@ class GraphQLClient:
         return self._post(payload)
 
     def _post(self, payload: Dict[str, Any], timeout: float = 30.0) -> GraphQLResponse:
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            r = client.post(self.endpoint, headers=dict(self.headers), json=payload)
+        r = get_shared_client().post(
+            self.endpoint,
+            headers=dict(self.headers),
+            json=payload,
+            timeout=timeout,
+            follow_redirects=True,
+        )
+        # Only build the HTTPStatusError machinery for actual error statuses
+        if r.status_code >= 400:
             r.raise_for_status()
-            return parse_graphql_response(r.text)
+        return parse_graphql_response(r.text)
 
     def mutation(
         self,
@@ -224,21 +260,7 @@ def get_input_value_fragment() -> str:
     Returns:
         str: GraphQL fragment string
     """
-    return """
-    fragment InputValue on __InputValue {
-        name
-        description
-        type {
-            name
-            kind
-            ofType {
-                name
-                kind
-            }
-        }
-        defaultValue
-    }
-    """
+    return INPUT_VALUE_FRAGMENT
 
 
 def get_type_ref_fragment() -> str:
@@ -247,17 +269,7 @@ def get_type_ref_fragment() -> str:
     Returns:
         str: GraphQL fragment string
     """
-    return """
-    fragment TypeRef on __Type {
-        name
-        kind
-        description
-        ofType {
-            name
-            kind
-        }
-    }
-    """
+    return TYPE_REF_FRAGMENT
 
 
 def introspect_schema(endpoint: str) -> Dict[str, Any]:
@@ -164,16 +164,15 @@ class HistoryManager:
         """Load history from file (JSON backend only)."""
         if self._sqlite:
             return
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    self.history = json.load(f)
-                if not isinstance(self.history, list):
-                    self.history = []
-            except (json.JSONDecodeError, OSError) as exc:
-                logger.warning("Could not load history %s: %s", self.history_file, exc)
+        try:
+            with open(self.history_file, "r", encoding="utf-8") as f:
+                self.history = json.load(f)
+            if not isinstance(self.history, list):
                 self.history = []
-        else:
+        except FileNotFoundError:
+            self.history = []
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Could not load history %s: %s", self.history_file, exc)
             self.history = []
 
     def save_history(self) -> None:
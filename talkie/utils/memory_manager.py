@@ -1,21 +1,66 @@
 """Memory management utilities for Talkie."""
 
+import asyncio
+import dataclasses
+import functools
 import gc
+import os
+import sys
+from collections import deque
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from ..utils.performance_config import get_performance_config
 
 try:
-    import psutil
-except ImportError:
-    psutil = None
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# Seconds between monitor samples
+_MONITOR_INTERVAL = 1.0
+
+
+def _gc_collections() -> int:
+    """Total collections run so far across all GC generations."""
+    return sum(stat['collections'] for stat in gc.get_stats())
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _psutil() -> Any:
+    """Import psutil on first use; None when it is not installed."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil
+
+
+@functools.lru_cache(maxsize=None)
+def _process(pid: int) -> Any:
+    """psutil handle for ``pid``; keyed by pid so a forked child gets its own."""
+    return _psutil().Process(pid)
 
 
 @dataclass
 class MemoryStats:
     """Memory usage statistics."""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "current_mb", "peak_mb", "available_mb",
+        "usage_percent", "gc_count", "timestamp",
+    )
+
     current_mb: float
     peak_mb: float
     available_mb: float
@@ -27,13 +72,28 @@ class MemoryStats:
 class MemoryManager:
     """Memory management and monitoring."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.config = get_performance_config()
         self.monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
-        self._stats: Dict[str, MemoryStats] = {}
-        self._callbacks: List[Callable[[MemoryStats], None]] = []
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._monitor_timer: Optional[asyncio.Handle] = None
+        self._first_sample = threading.Event()
+        # Set by stop_monitoring so the monitor thread wakes up instead of sleeping on
+        self._stop_event = threading.Event()
+        # Recent monitor samples; the oldest drop off once the window is full
+        self._history: Deque[MemoryStats] = deque(maxlen=self.config.stats_window_size)
+        self._peak_mb = 0.0
+        # Replaced, never mutated, so the sampler can iterate without the lock
+        self._callbacks: Tuple[Callable[[MemoryStats], None], ...] = ()
+        # Samples waiting for the dispatcher thread; the oldest are dropped when full
+        self._pending: Deque[MemoryStats] = deque(maxlen=self.config.callback_queue_max)
+        self._pending_ready = threading.Condition()
         self._lock = threading.Lock()
+        # Last probe result, reused until the deadline (time.monotonic_ns)
+        self._cached_stats: Optional[MemoryStats] = None
+        self._cache_deadline_ns = 0
+        self._last_summary: Optional[Dict[str, Any]] = None
 
     def start_monitoring(self) -> None:
         """Start memory monitoring."""
@@ -41,40 +101,96 @@ class MemoryManager:
             return
 
         self.monitoring = True
+        self._first_sample.clear()
+        self._stop_event.clear()
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, daemon=True
+        )
+        self._dispatch_thread.start()
         self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._monitor_thread.start()
 
+    def start_async(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """
+        Start memory monitoring on an event loop instead of a thread.
+
+        Samples are taken by a callback rescheduled with ``loop.call_later``.
+        Without ``loop`` the running loop is used; if there is none, this
+        falls back to thread mode.
+
+        Args:
+            loop: Event loop to sample on
+        """
+        if self.monitoring:
+            return
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.start_monitoring()
+                return
+
+        self.monitoring = True
+        self._first_sample.clear()
+        self._monitor_timer = loop.call_soon(self._async_tick, loop)
+
     def stop_monitoring(self) -> None:
         """Stop memory monitoring."""
         self.monitoring = False
+        self._stop_event.set()
+        if self._monitor_timer is not None:
+            self._monitor_timer.cancel()
+            self._monitor_timer = None
+        with self._pending_ready:
+            self._pending_ready.notify_all()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=1.0)
+        if self._dispatch_thread:
+            self._dispatch_thread.join(timeout=1.0)
 
     def add_callback(self, callback: Callable[[MemoryStats], None]) -> None:
         """Add memory monitoring callback."""
         with self._lock:
-            self._callbacks.append(callback)
+            self._callbacks = self._callbacks + (callback,)
 
     def remove_callback(self, callback: Callable[[MemoryStats], None]) -> None:
         """Remove memory monitoring callback."""
         with self._lock:
             if callback in self._callbacks:
-                self._callbacks.remove(callback)
+                callbacks = list(self._callbacks)
+                callbacks.remove(callback)
+                self._callbacks = tuple(callbacks)
 
     def get_current_stats(self) -> MemoryStats:
-        """Get current memory statistics."""
+        """Get current memory statistics.
+
+        Calls within ``memory_stats_ttl_ms`` of the last probe return the
+        same snapshot instead of querying the OS again.
+        """
+        now_ns = time.monotonic_ns()
+        cached = self._cached_stats
+        if cached is not None and now_ns < self._cache_deadline_ns:
+            return cached
+
+        stats = self._probe_stats()
+        self._cached_stats = stats
+        ttl_ns = int(self.config.memory_stats_ttl_ms * 1_000_000)
+        self._cache_deadline_ns = now_ns + ttl_ns
+        return stats
+
+    def _probe_stats(self) -> MemoryStats:
+        psutil = _psutil()
         if psutil is None:
             return MemoryStats(
                 current_mb=0.0,
                 peak_mb=0.0,
                 available_mb=0.0,
                 usage_percent=0.0,
-                gc_count=0,
+                gc_count=_gc_collections(),
                 timestamp=time.time()
             )
 
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        memory_info = _process(os.getpid()).memory_info()
 
         # Get system memory info
         system_memory = psutil.virtual_memory()
@@ -83,39 +199,63 @@ class MemoryManager:
         available_mb = system_memory.available / 1024 / 1024
         usage_percent = system_memory.percent
 
-        # Get GC stats
-        gc_stats = gc.get_stats()
-        gc_count = sum(stat['collections'] for stat in gc_stats)
-
         return MemoryStats(
             current_mb=current_mb,
             peak_mb=current_mb,  # Will be updated by monitoring
             available_mb=available_mb,
             usage_percent=usage_percent,
-            gc_count=gc_count,
+            gc_count=_gc_collections(),
             timestamp=time.time()
         )
 
     def get_peak_memory(self) -> float:
         """Get peak memory usage in MB."""
-        with self._lock:
-            if not self._stats:
-                return 0.0
-            return max(stats.peak_mb for stats in self._stats.values())
+        return self._peak_mb
+
+    def wait_for_sample(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the monitor has recorded a sample since it last started.
+
+        Args:
+            timeout: Seconds to wait; None waits indefinitely
+
+        Returns:
+            bool: True if a sample exists, False if the timeout expired
+        """
+        return self._first_sample.wait(timeout)
+
+    def get_history(self) -> List[MemoryStats]:
+        """Get the retained monitor samples, oldest first."""
+        return list(self._history)
 
     def force_gc(self) -> None:
         """Force garbage collection."""
         collected = gc.collect()
+        # The cached snapshot predates the collection; the next read must probe
+        self._cache_deadline_ns = 0
         if self.config.log_performance_metrics:
             print(f"Garbage collection freed {collected} objects")
 
     def check_memory_limit(self) -> bool:
         """Check if memory usage exceeds configured limit."""
+        # Current RSS never exceeds the peak, so a peak under the limit settles it
+        peak_mb = _peak_rss_mb()
+        if peak_mb is not None and peak_mb <= self.config.max_memory_usage_mb:
+            return False
         stats = self.get_current_stats()
         return stats.current_mb > self.config.max_memory_usage_mb
 
     def optimize_memory(self) -> None:
-        """Optimize memory usage."""
+        """
+        Optimize memory usage.
+
+        Collections only run when usage is over the configured limit; below
+        it this is a no-op and CPython's own generational collector (see
+        gc.get_threshold) keeps handling young objects.
+        """
+        if not self.check_memory_limit():
+            return
+
         # Force garbage collection
         self.force_gc()
 
@@ -127,59 +267,103 @@ class MemoryManager:
                 if not self.check_memory_limit():
                     break
 
+    def _sample_once(self) -> MemoryStats:
+        """Take one monitor sample and enforce the memory limit."""
+        stats = self._record(self.get_current_stats())
+        if not self._first_sample.is_set():
+            self._first_sample.set()
+
+        # Check memory limit
+        if stats.current_mb > self.config.max_memory_usage_mb:
+            self.optimize_memory()
+        return stats
+
+    def _notify(self, stats: MemoryStats) -> None:
+        """Call callbacks outside the lock so a slow one cannot stall readers."""
+        for callback in self._callbacks:
+            try:
+                callback(stats)
+            except Exception:
+                pass  # Ignore callback errors
+
+    def _enqueue(self, stats: MemoryStats) -> None:
+        """Hand a sample to the dispatcher thread, dropping the oldest if full."""
+        with self._pending_ready:
+            self._pending.append(stats)
+            self._pending_ready.notify()
+
     def _monitor_loop(self) -> None:
         """Internal monitoring loop."""
         while self.monitoring:
             try:
-                stats = self.get_current_stats()
-
-                # Update peak memory
-                with self._lock:
-                    key = f"monitor_{threading.current_thread().ident}"
-                    if key in self._stats:
-                        stats.peak_mb = max(stats.current_mb, self._stats[key].peak_mb)
-                    self._stats[key] = stats
-
-                # Check memory limit
-                if stats.current_mb > self.config.max_memory_usage_mb:
-                    self.optimize_memory()
-
-                # Call callbacks
-                with self._lock:
-                    for callback in self._callbacks:
-                        try:
-                            callback(stats)
-                        except Exception:
-                            pass  # Ignore callback errors
-
-                # Sleep for a short time
-                time.sleep(1.0)  # Monitor every second
-
+                self._enqueue(self._sample_once())
+                self._stop_event.wait(_MONITOR_INTERVAL)
             except Exception:
                 break  # Exit gracefully on any error
 
+    def _dispatch_loop(self) -> None:
+        """Run callbacks for queued samples so they never delay sampling."""
+        while True:
+            with self._pending_ready:
+                while not self._pending and self.monitoring:
+                    self._pending_ready.wait()
+                if not self._pending:
+                    return
+                stats = self._pending.popleft()
+            self._notify(stats)
+
+    def _async_tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Event-loop counterpart of _monitor_loop: sample, then reschedule."""
+        if not self.monitoring:
+            return
+        try:
+            # Callbacks stay on the loop thread in this mode
+            self._notify(self._sample_once())
+        except Exception:
+            self.monitoring = False  # Stop gracefully on any error
+            return
+        self._monitor_timer = loop.call_later(_MONITOR_INTERVAL, self._async_tick, loop)
+
+    def _record(self, stats: MemoryStats) -> MemoryStats:
+        """Update the peak and append a sample to the history."""
+        with self._lock:
+            # Copy: the probe result may be handed out to other callers
+            stats = dataclasses.replace(
+                stats, peak_mb=max(stats.current_mb, self._peak_mb)
+            )
+            self._peak_mb = stats.peak_mb
+            self._history.append(stats)
+        return stats
+
     def get_stats_summary(self) -> Dict[str, Any]:
-        """Get memory statistics summary."""
+        """Get memory statistics summary.
+
+        Never waits on the monitor thread: if it holds the lock, the previous
+        summary is returned instead.
+        """
+        if self._lock.locked() and self._last_summary is not None:
+            return dict(self._last_summary)
         with self._lock:
-            if not self._stats:
+            if not self._history:
                 return {"error": "No monitoring data available"}
-
-            current_stats = self.get_current_stats()
-            peak_memory = self.get_peak_memory()
-
-            return {
-                "current_memory_mb": current_stats.current_mb,
-                "peak_memory_mb": peak_memory,
-                "available_memory_mb": current_stats.available_mb,
-                "usage_percent": current_stats.usage_percent,
-                "gc_count": current_stats.gc_count,
-                "monitoring_active": self.monitoring,
-                "config": {
-                    "max_memory_mb": self.config.max_memory_usage_mb,
-                    "gc_threshold": self.config.gc_threshold,
-                    "memory_monitoring_enabled": self.config.enable_memory_monitoring
-                }
+            peak_memory = self._peak_mb
+
+        current_stats = self.get_current_stats()
+        summary = {
+            "current_memory_mb": current_stats.current_mb,
+            "peak_memory_mb": peak_memory,
+            "available_memory_mb": current_stats.available_mb,
+            "usage_percent": current_stats.usage_percent,
+            "gc_count": current_stats.gc_count,
+            "monitoring_active": self.monitoring,
+            "config": {
+                "max_memory_mb": self.config.max_memory_usage_mb,
+                "gc_threshold": self.config.gc_threshold,
+                "memory_monitoring_enabled": self.config.enable_memory_monitoring
             }
+        }
+        self._last_summary = summary
+        return dict(summary)
 
 
 # Global memory manager instance
@@ -213,6 +397,6 @@ def get_memory_stats() -> Dict[str, Any]:
 
 
 def optimize_memory() -> None:
-    """Optimize memory usage."""
+    """Optimize memory usage; a no-op while usage is under the limit."""
     manager = get_memory_manager()
     manager.optimize_memory()
@@ -1,14 +1,17 @@
 """Module for OpenAPI specification handling."""
 
+import functools
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 from urllib.parse import urljoin
 
 import httpx
 import yaml
 
+from talkie.core.client import get_shared_client
+
 logger = logging.getLogger("talkie.openapi")
 
 
@@ -29,17 +32,17 @@ class OpenAPIClient:
 
         self.base_url = self._get_base_url()
         self.paths = self.spec.get("paths", {})
-        self.operations = self._extract_operations()
 
     def _load_spec(self, spec_source: str) -> Dict[str, Any]:
         """Load OpenAPI specification from URL, file path (.json/.yaml), or YAML/JSON string."""
         raw: Union[str, bytes]
         if spec_source.startswith(("http://", "https://")):
             try:
-                with httpx.Client(follow_redirects=True, timeout=30.0) as client:
-                    r = client.get(spec_source)
-                    r.raise_for_status()
-                    raw = r.text
+                r = get_shared_client().get(
+                    spec_source, follow_redirects=True, timeout=30.0
+                )
+                r.raise_for_status()
+                raw = r.text
             except httpx.HTTPError as exc:
                 logger.warning("Failed to fetch OpenAPI from URL: %s", exc)
                 raise ValueError(f"Could not fetch OpenAPI spec: {exc}") from exc
@@ -75,14 +78,25 @@ class OpenAPIClient:
             return servers[0].get("url", "")
         return ""
 
+    @functools.cached_property
+    def operations(self) -> List[Dict[str, Any]]:
+        """All operations in the specification, built on first access."""
+        return self._extract_operations()
+
     def _extract_operations(self) -> List[Dict[str, Any]]:
         """Extract all operations from specification.
 
         Returns:
             List[Dict[str, Any]]: List of operations
         """
-        operations = []
+        return list(self.iter_operations())
+
+    def iter_operations(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over operations without building the full list.
 
+        Yields:
+            Dict[str, Any]: Operation with its path and upper-case method
+        """
         http_methods = frozenset(
             ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
         )
@@ -94,15 +108,11 @@ class OpenAPIClient:
                     continue
                 if not isinstance(operation, dict):
                     continue
-                operations.append(
-                    {
-                        "path": path,
-                        "method": method.upper(),
-                        "operation": operation,
-                    }
-                )
-
-        return operations
+                yield {
+                    "path": path,
+                    "method": method.upper(),
+                    "operation": operation,
+                }
 
     def get_operation(self, path: str, method: str) -> Optional[Dict[str, Any]]:
         """Get specific operation.
@@ -1,5 +1,7 @@
 """OpenAPI client code generator for Talkie."""
 
+import keyword
+import re
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from dataclasses import dataclass
@@ -33,12 +35,13 @@ class OpenApiClientGenerator:
         self.spec_url = spec_url
         self.class_name = class_name
         self.inspector = OpenAPIClient(spec_url)
-        self.spec = None
+        self.spec: Dict[str, Any] = {}
         self.generated_methods: List[GeneratedMethod] = []
 
     def load_specification(self) -> None:
         """Load OpenAPI specification."""
-        self.spec = self.inspector.load_spec(self.spec_url)
+        # OpenAPIClient already loaded the document; reuse it instead of fetching again
+        self.spec = self.inspector.spec
 
     def generate_client(self, output_dir: str = "generated_client") -> str:
         """
@@ -497,7 +500,6 @@ talkie generate-client {self.spec_url} --output ./generated_client
 
     def _to_snake_case(self, text: str) -> str:
         """Convert text to snake_case."""
-        import re
         # Replace special characters with underscores
         text = re.sub(r'[^a-zA-Z0-9]', '_', text)
         # Convert camelCase to snake_case
@@ -506,16 +508,12 @@ talkie generate-client {self.spec_url} --output ./generated_client
 
     def _to_pascal_case(self, text: str) -> str:
         """Convert text to PascalCase."""
-        import re
         # Split by non-alphanumeric characters
         words = re.split(r'[^a-zA-Z0-9]', text)
         return ''.join(word.capitalize() for word in words if word)
 
     def _sanitize_method_name(self, name: str) -> str:
         """Sanitize method name to be valid Python identifier."""
-        import keyword
-        import re
-
         # Remove invalid characters
         name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
 
@@ -1,10 +1,19 @@
 """Performance configuration and optimization settings."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Dict, Any, Optional
 import os
 
 
+# Accepted spellings for an enabled boolean environment variable
+_TRUE = frozenset({"1", "true", "yes", "on", "t", "y"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable; anything not in _TRUE is False."""
+    return value.strip().lower() in _TRUE
+
+
 @dataclass
 class PerformanceConfig:
     """Configuration for performance optimizations."""
@@ -32,6 +41,9 @@ class PerformanceConfig:
     max_memory_usage_mb: float = 500.0
     gc_threshold: int = 1000
     enable_memory_monitoring: bool = True
+    memory_stats_ttl_ms: float = 100.0
+    stats_window_size: int = 600
+    callback_queue_max: int = 16
 
     # Logging settings
     log_performance_metrics: bool = True
@@ -52,8 +64,8 @@ class PerformanceConfig:
             max_keepalive_connections=int(os.getenv("TALKIE_MAX_KEEPALIVE", "20")),
             connection_timeout=float(os.getenv("TALKIE_CONNECTION_TIMEOUT", "30.0")),
             read_timeout=float(os.getenv("TALKIE_READ_TIMEOUT", "30.0")),
-            enable_http2=os.getenv("TALKIE_HTTP2", "true").lower() == "true",
-            cache_enabled=os.getenv("TALKIE_CACHE_ENABLED", "true").lower() == "true",
+            enable_http2=_parse_bool(os.getenv("TALKIE_HTTP2", "true")),
+            cache_enabled=_parse_bool(os.getenv("TALKIE_CACHE_ENABLED", "true")),
             cache_max_size_mb=float(os.getenv("TALKIE_CACHE_MAX_SIZE_MB", "100.0")),
             cache_max_entries=int(os.getenv("TALKIE_CACHE_MAX_ENTRIES", "1000")),
             cache_ttl_seconds=int(os.getenv("TALKIE_CACHE_TTL", "3600")),
@@ -63,8 +75,15 @@ class PerformanceConfig:
             batch_size=int(os.getenv("TALKIE_BATCH_SIZE", "10")),
             max_memory_usage_mb=float(os.getenv("TALKIE_MAX_MEMORY_MB", "500.0")),
             gc_threshold=int(os.getenv("TALKIE_GC_THRESHOLD", "1000")),
-            enable_memory_monitoring=os.getenv("TALKIE_MEMORY_MONITORING", "true").lower() == "true",
-            log_performance_metrics=os.getenv("TALKIE_LOG_PERFORMANCE", "true").lower() == "true",
+            enable_memory_monitoring=_parse_bool(
+                os.getenv("TALKIE_MEMORY_MONITORING", "true")
+            ),
+            memory_stats_ttl_ms=float(os.getenv("TALKIE_MEMORY_STATS_TTL_MS", "100.0")),
+            stats_window_size=int(os.getenv("TALKIE_STATS_WINDOW_SIZE", "600")),
+            callback_queue_max=int(os.getenv("TALKIE_CALLBACK_QUEUE_MAX", "16")),
+            log_performance_metrics=_parse_bool(
+                os.getenv("TALKIE_LOG_PERFORMANCE", "true")
+            ),
             log_level=os.getenv("TALKIE_LOG_LEVEL", "INFO"),
             max_log_file_size_mb=float(os.getenv("TALKIE_MAX_LOG_SIZE_MB", "10.0")),
             max_log_files=int(os.getenv("TALKIE_MAX_LOG_FILES", "5")),
@@ -75,31 +94,7 @@ class PerformanceConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "max_connections": self.max_connections,
-            "max_keepalive_connections": self.max_keepalive_connections,
-            "connection_timeout": self.connection_timeout,
-            "read_timeout": self.read_timeout,
-            "enable_http2": self.enable_http2,
-            "cache_enabled": self.cache_enabled,
-            "cache_max_size_mb": self.cache_max_size_mb,
-            "cache_max_entries": self.cache_max_entries,
-            "cache_ttl_seconds": self.cache_ttl_seconds,
-            "cache_max_response_size_mb": self.cache_max_response_size_mb,
-            "max_concurrent_requests": self.max_concurrent_requests,
-            "request_delay_ms": self.request_delay_ms,
-            "batch_size": self.batch_size,
-            "max_memory_usage_mb": self.max_memory_usage_mb,
-            "gc_threshold": self.gc_threshold,
-            "enable_memory_monitoring": self.enable_memory_monitoring,
-            "log_performance_metrics": self.log_performance_metrics,
-            "log_level": self.log_level,
-            "max_log_file_size_mb": self.max_log_file_size_mb,
-            "max_log_files": self.max_log_files,
-            "benchmark_warmup_requests": self.benchmark_warmup_requests,
-            "benchmark_sample_size": self.benchmark_sample_size,
-            "benchmark_timeout_seconds": self.benchmark_timeout_seconds
-        }
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
 
     def validate(self) -> None:
         """Validate configuration values."""
@@ -127,6 +122,12 @@ class PerformanceConfig:
             raise ValueError("max_memory_usage_mb must be positive")
         if self.gc_threshold <= 0:
             raise ValueError("gc_threshold must be positive")
+        if self.memory_stats_ttl_ms < 0:
+            raise ValueError("memory_stats_ttl_ms must be non-negative")
+        if self.stats_window_size <= 0:
+            raise ValueError("stats_window_size must be positive")
+        if self.callback_queue_max <= 0:
+            raise ValueError("callback_queue_max must be positive")
         if self.max_log_file_size_mb <= 0:
             raise ValueError("max_log_file_size_mb must be positive")
         if self.max_log_files <= 0:
@@ -139,6 +140,9 @@ class PerformanceConfig:
             raise ValueError("benchmark_timeout_seconds must be positive")
 
 
+# Field names in declaration order, computed once instead of per to_dict()
+_FIELD_NAMES = tuple(field.name for field in fields(PerformanceConfig))
+
 # Global performance configuration
 _performance_config: Optional[PerformanceConfig] = None
 
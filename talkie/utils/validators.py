@@ -1,14 +1,55 @@
 """Input validation utilities for Talkie."""
 
+import functools
+import json
 import re
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 
+# Compiled once; validators run for every request in a parallel batch
+_FLOAT_RE = re.compile(r'^\d+\.\d+$')
+# key:=value literals, matched case-insensitively
+_JSON_LITERALS = {'true': True, 'false': False, 'null': None}
+
+_HTTP_METHODS = frozenset({
+    'GET', 'POST', 'PUT', 'DELETE', 'PATCH',
+    'HEAD', 'OPTIONS', 'TRACE', 'CONNECT'
+})
+_OUTPUT_FORMATS = frozenset({'json', 'xml', 'html', 'markdown', 'text'})
+# Canonical spelling for the common all-upper/all-lower inputs; other
+# casings fall back to str.upper()/str.lower()
+_HTTP_METHOD_ALIASES = {
+    **{m: m for m in _HTTP_METHODS}, **{m.lower(): m for m in _HTTP_METHODS}
+}
+_OUTPUT_FORMAT_ALIASES = {
+    **{f: f for f in _OUTPUT_FORMATS}, **{f.upper(): f for f in _OUTPUT_FORMATS}
+}
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
 
 
+def _split_pair(item: str, sep: str) -> Optional[Tuple[str, str]]:
+    """
+    Split ``key<sep>value`` with str.partition.
+
+    Accepts the same inputs as the ``^([^c]+)<sep>(.*)$`` patterns it
+    replaces (``c`` being the first separator character): the key is
+    non-empty and free of ``c``, and the value has no line break except
+    an optional trailing one.
+
+    Returns:
+        Optional[Tuple[str, str]]: Stripped key and value, or None if the
+        item does not have that shape
+    """
+    key, found, value = item.partition(sep)
+    if not found or not key or sep[0] in key or '\n' in value[:-1]:
+        return None
+    return key.strip(), value.strip()
+
+
 # Convenience functions for direct import
 def validate_url(url: str) -> str:
     """Validate URL format."""
@@ -20,6 +61,23 @@ def validate_json(data: str) -> Dict[str, Any]:
     return InputValidator.validate_json(data)
 
 
+@functools.lru_cache(maxsize=1024)
+def _validate_url_cached(url: str) -> str:
+    """Validate and normalize a URL; batch runs repeat the same URLs."""
+    if not url:
+        raise ValidationError("URL cannot be empty")
+
+    # Add http:// if no scheme provided
+    if not url.startswith(('http://', 'https://')):
+        url = f'http://{url}'
+
+    parsed = urlparse(url)
+    if not parsed.netloc or parsed.netloc == '':
+        raise ValidationError(f"Invalid URL format: {url}")
+
+    return url
+
+
 class InputValidator:
     """Utility class for validating command line inputs."""
 
@@ -37,18 +95,7 @@ class InputValidator:
         Raises:
             ValidationError: If URL is invalid
         """
-        if not url:
-            raise ValidationError("URL cannot be empty")
-
-        # Add http:// if no scheme provided
-        if not url.startswith(('http://', 'https://')):
-            url = f'http://{url}'
-
-        parsed = urlparse(url)
-        if not parsed.netloc or parsed.netloc == '':
-            raise ValidationError(f"Invalid URL format: {url}")
-
-        return url
+        return _validate_url_cached(url)
 
     @staticmethod
     def validate_timeout(timeout: float) -> float:
@@ -85,18 +132,15 @@ class InputValidator:
             ValidationError: If header format is invalid
         """
         parsed_headers = {}
-        header_pattern = re.compile(r'^([^:]+):(.*)$')
 
         for header in headers:
-            match = header_pattern.match(header)
-            if not match:
+            pair = _split_pair(header, ':')
+            if pair is None:
                 raise ValidationError(
                     f"Invalid header format: '{header}'. Expected format: 'key:value'"
                 )
 
-            key, value = match.groups()
-            key = key.strip()
-            value = value.strip()
+            key, value = pair
 
             if not key:
                 raise ValidationError(f"Empty header key in: '{header}'")
@@ -120,19 +164,16 @@ class InputValidator:
             ValidationError: If parameter format is invalid
         """
         parsed_params = {}
-        param_pattern = re.compile(r'^([^=]+)=(.*)$')
 
         for param in params:
-            match = param_pattern.match(param)
-            if not match:
+            pair = _split_pair(param, '=')
+            if pair is None:
                 raise ValidationError(
                     f"Invalid query parameter format: '{param}'. "
                     f"Expected format: 'key=value'"
                 )
 
-            key, value = match.groups()
-            key = key.strip()
-            value = value.strip()
+            key, value = pair
 
             if not key:
                 raise ValidationError(f"Empty parameter key in: '{param}'")
@@ -156,33 +197,25 @@ class InputValidator:
             ValidationError: If data format is invalid
         """
         form_data = {}
-        json_data = {}
-
-        form_pattern = re.compile(r'^([^=]+)=(.*)$')
-        json_pattern = re.compile(r'^([^:]+):=(.*)$')
+        json_data: Dict[str, Any] = {}
 
         for item in data:
             # Check for JSON data format (key:=value)
-            json_match = json_pattern.match(item)
-            if json_match:
-                key, value = json_match.groups()
-                key = key.strip()
-                value = value.strip()
+            pair = _split_pair(item, ':=')
+            if pair is not None:
+                key, value = pair
 
                 if not key:
                     raise ValidationError(f"Empty JSON key in: '{item}'")
 
                 # Try to parse JSON value
                 try:
-                    if value.lower() == 'true':
-                        json_data[key] = True
-                    elif value.lower() == 'false':
-                        json_data[key] = False
-                    elif value.lower() == 'null':
-                        json_data[key] = None
+                    lowered = value.lower()
+                    if lowered in _JSON_LITERALS:
+                        json_data[key] = _JSON_LITERALS[lowered]
                     elif value.isdigit():
                         json_data[key] = int(value)
-                    elif re.match(r'^\d+\.\d+$', value):
+                    elif _FLOAT_RE.match(value):
                         json_data[key] = float(value)
                     else:
                         json_data[key] = value
@@ -193,11 +226,9 @@ class InputValidator:
                 continue
 
             # Check for form data format (key=value)
-            form_match = form_pattern.match(item)
-            if form_match:
-                key, value = form_match.groups()
-                key = key.strip()
-                value = value.strip()
+            pair = _split_pair(item, '=')
+            if pair is not None:
+                key, value = pair
 
                 if not key:
                     raise ValidationError(f"Empty form key in: '{item}'")
@@ -230,13 +261,15 @@ class InputValidator:
         if format_name is None:
             return None
 
-        valid_formats = {'json', 'xml', 'html', 'markdown', 'text'}
-        format_name = format_name.lower()
+        canonical = _OUTPUT_FORMAT_ALIASES.get(format_name)
+        if canonical is not None:
+            return canonical
 
-        if format_name not in valid_formats:
+        format_name = format_name.lower()
+        if format_name not in _OUTPUT_FORMATS:
             raise ValidationError(
                 f"Invalid output format: '{format_name}'. "
-                f"Valid formats: {', '.join(sorted(valid_formats))}"
+                f"Valid formats: {', '.join(sorted(_OUTPUT_FORMATS))}"
             )
 
         return format_name
@@ -258,16 +291,15 @@ class InputValidator:
         if not method:
             raise ValidationError("HTTP method cannot be empty")
 
-        method = method.upper()
-        valid_methods = {
-            'GET', 'POST', 'PUT', 'DELETE', 'PATCH',
-            'HEAD', 'OPTIONS', 'TRACE', 'CONNECT'
-        }
+        canonical = _HTTP_METHOD_ALIASES.get(method)
+        if canonical is not None:
+            return canonical
 
-        if method not in valid_methods:
+        method = method.upper()
+        if method not in _HTTP_METHODS:
             raise ValidationError(
                 f"Invalid HTTP method: '{method}'. "
-                f"Valid methods: {', '.join(sorted(valid_methods))}"
+                f"Valid methods: {', '.join(sorted(_HTTP_METHODS))}"
             )
 
         return method
@@ -287,7 +319,6 @@ class InputValidator:
             ValidationError: If JSON is invalid
         """
         try:
-            import json
             return json.loads(data)
         except json.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON format: {e}")
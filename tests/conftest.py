@@ -1,15 +1,12 @@
 """Конфигурация и общие фикстуры для тестов."""
 
 import talkie  # noqa: F401 - ensure package is loaded for coverage
-import os
-import tempfile
-import subprocess
-import sys
+import json
 from datetime import timedelta
+from pathlib import Path
 from typing import Generator
 
 import pytest
-from _pytest.fixtures import SubRequest
 
 
 def pytest_configure(config):
@@ -21,16 +18,13 @@ def pytest_configure(config):
 
 
 @pytest.fixture
-def temp_config_dir() -> Generator[str, None, None]:
-    """Создает временный каталог конфигурации для тестов."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        old_config_dir = os.environ.get("TALKIE_CONFIG_DIR")
-        os.environ["TALKIE_CONFIG_DIR"] = temp_dir
-        yield temp_dir
-        if old_config_dir:
-            os.environ["TALKIE_CONFIG_DIR"] = old_config_dir
-        else:
-            del os.environ["TALKIE_CONFIG_DIR"]
+def temp_config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Создает временный каталог конфигурации для тестов.
+
+    Переменную окружения восстанавливает monkeypatch, даже если тест упал.
+    """
+    monkeypatch.setenv("TALKIE_CONFIG_DIR", str(tmp_path))
+    return str(tmp_path)
 
 
 class MockURL:
@@ -68,7 +62,6 @@ class MockResponse:
         return self._content.decode('utf-8')
 
     def json(self) -> dict:
-        import json
         return json.loads(self.text)
 
     def raise_for_status(self) -> None:
@@ -76,47 +69,6 @@ class MockResponse:
             raise Exception(f"HTTP Error: {self.status_code}")
 
 
-def create_temp_certificate() -> str:
-    """
-    Создает временный файл сертификата для тестов.
-    
-    Returns:
-        str: Путь к временному файлу сертификата
-    """
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.pem', delete=False) as f:
-        f.write("fake certificate content")
-        return f.name
-
-
-def run_talkie_command(command, expected_exit_code=0):
-    """
-    Запускает команду talkie и возвращает результат.
-    
-    Args:
-        command: Список аргументов команды
-        expected_exit_code: Ожидаемый код выхода
-        
-    Returns:
-        subprocess.CompletedProcess: Результат выполнения команды
-    """
-    # Используем python вместо python3 на Windows
-    python_cmd = "python" if sys.platform == "win32" else "python3"
-    full_command = [python_cmd, "-m", "talkie"] + command
-    process = subprocess.run(
-        full_command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-
-    if process.returncode != expected_exit_code:
-        print(f"Command failed with exit code {process.returncode}")
-        print(f"STDOUT: {process.stdout}")
-        print(f"STDERR: {process.stderr}")
-
-    return process
-
-
 @pytest.fixture
 def mock_http_response(monkeypatch: pytest.MonkeyPatch) -> None:
     """Мок для HTTP-ответов в тестах."""
@@ -130,31 +82,19 @@ def mock_http_response(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("talkie.core.client.httpx.Client", MockClient)
 
 
-@pytest.fixture
-def mock_server(request: SubRequest) -> Generator:
-    """Запускает мок HTTP-сервер для интеграционных тестов."""
+@pytest.fixture(scope="session")
+def mock_server() -> Generator:
+    """Запускает один мок HTTP-сервер на всю сессию тестов.
+
+    Ожидания регистрируют сами тесты и сбрасывают
+    через server.clear(), поэтому сокет не пересоздается для каждого теста.
+    """
     pytest.importorskip("pytest_httpserver")
     from pytest_httpserver import HTTPServer
 
     server = HTTPServer()
     server.start()
-
-    # Настраиваем мок-ответы
-    server.expect_request("/api/users", method="GET").respond_with_json([
-        {"id": 1, "name": "User 1"},
-        {"id": 2, "name": "User 2"}
-    ])
-
-    server.expect_request("/api/users", method="POST").respond_with_json(
-        {"id": 3, "name": "New User"}
-    )
-
-    server.expect_request("/api/users/1").respond_with_json(
-        {"id": 1, "name": "User 1", "email": "user1@example.com"}
-    )
-
     yield server
-
     server.stop()
 
 
@@ -1,5 +1,7 @@
 """Tests for cache module."""
 
+import gzip
+import hashlib
 import json
 import tempfile
 import time
@@ -128,6 +130,18 @@ class TestCacheEntry:
         assert new_entry.status_code == entry.status_code
 
 
+def _get_response(url: str, content: bytes = b"test", **kwargs) -> httpx.Response:
+    """Build a 200 response to a GET of url; kwargs override Response arguments."""
+    kwargs.setdefault("status_code", 200)
+    return httpx.Response(content=content, request=httpx.Request("GET", url), **kwargs)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Response cache with the default config in a fresh directory."""
+    return ResponseCache(CacheConfig(cache_dir=str(tmp_path)))
+
+
 class TestResponseCache:
     """Test response cache."""
     
@@ -138,60 +152,89 @@ class TestResponseCache:
             cache = ResponseCache(config)
             assert cache.config == config
             assert cache.cache_dir == Path(temp_dir)
-            assert cache.index == {}
+            assert not cache.index
 
-    def test_cache_key_generation(self):
+    def test_cache_key_generation(self, cache):
         """Test cache key generation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = CacheConfig(cache_dir=temp_dir)
-            cache = ResponseCache(config)
-            
-            # Test basic key generation
-            key_data1 = CacheKeyData(method="GET", url="https://example.com")
-            key1 = cache._generate_cache_key(key_data1)
-            key2 = cache._generate_cache_key(key_data1)
-            assert key1 == key2  # Same request should generate same key
-            
-            # Test different requests generate different keys
-            key_data3 = CacheKeyData(method="POST", url="https://example.com")
-            key3 = cache._generate_cache_key(key_data3)
-            assert key1 != key3
-            
-            # Test with headers
-            key_data4 = CacheKeyData(
-                method="GET",
-                url="https://example.com",
-                headers={"Authorization": "Bearer token"}
-            )
-            key_data5 = CacheKeyData(
-                method="GET",
-                url="https://example.com",
-                headers={"Authorization": "Bearer different-token"}
-            )
-            key4 = cache._generate_cache_key(key_data4)
-            key5 = cache._generate_cache_key(key_data5)
-            assert key4 != key5
+        # Test basic key generation
+        key_data1 = CacheKeyData(method="GET", url="https://example.com")
+        key1 = cache._generate_cache_key(key_data1)
+        key2 = cache._generate_cache_key(key_data1)
+        assert key1 == key2  # Same request should generate same key
+        
+        # Test different requests generate different keys
+        key_data3 = CacheKeyData(method="POST", url="https://example.com")
+        key3 = cache._generate_cache_key(key_data3)
+        assert key1 != key3
+        
+        # Test with headers
+        key_data4 = CacheKeyData(
+            method="GET",
+            url="https://example.com",
+            headers={"Authorization": "Bearer token"}
+        )
+        key_data5 = CacheKeyData(
+            method="GET",
+            url="https://example.com",
+            headers={"Authorization": "Bearer different-token"}
+        )
+        key4 = cache._generate_cache_key(key_data4)
+        key5 = cache._generate_cache_key(key_data5)
+        assert key4 != key5
+
+    def test_cache_key_hashes_canonical_json(self, cache):
+        """Test that keys hash compact, key-sorted stdlib JSON."""
+        key_data = CacheKeyData(
+            method="GET",
+            url="https://example.com/search",
+            params={"q": "привет", "ratio": 1e16},
+        )
+        material = json.dumps(
+            {
+                "body": "",
+                "headers": {},
+                "method": "GET",
+                "params": {"q": "привет", "ratio": 1e16},
+                "url": "https://example.com/search",
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        with patch("talkie.utils.cache.xxhash", None):
+            key = cache._generate_cache_key(key_data)
+        assert key == hashlib.blake2b(material, digest_size=16).hexdigest()
+
+    def test_cache_key_without_xxhash(self, cache):
+        """Test that keys fall back to a 128-bit blake2b digest."""
+        key_data = CacheKeyData(method="GET", url="https://example.com")
+        with patch("talkie.utils.cache.xxhash", None):
+            key = cache._generate_cache_key(key_data)
+        assert len(key) == 32
+        int(key, 16)
 
-    def test_should_cache_request(self):
+    @pytest.mark.parametrize(
+        "method,headers,body,expected",
+        [
+            ("GET", {}, None, True),
+            ("POST", {}, None, False),
+            (
+                "POST",
+                {"Content-Type": "application/json"},
+                '{"query": "{ users { id name } }"}',
+                True,
+            ),
+            (
+                "POST",
+                {"Content-Type": "application/json"},
+                '{"query": "mutation { createUser(name: \"test\") { id } }"}',
+                False,
+            ),
+        ],
+        ids=["get", "plain-post", "graphql-query", "graphql-mutation"],
+    )
+    def test_should_cache_request(self, cache, method, headers, body, expected):
         """Test request caching logic."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = CacheConfig(cache_dir=temp_dir)
-            cache = ResponseCache(config)
-            
-            # GET requests should be cached by default
-            assert cache._should_cache_request("GET", {})
-            
-            # POST requests should not be cached by default
-            assert not cache._should_cache_request("POST", {})
-            
-            # GraphQL queries should be cached
-            headers = {"Content-Type": "application/json"}
-            body = '{"query": "{ users { id name } }"}'
-            assert cache._should_cache_request("POST", headers, body)
-            
-            # GraphQL mutations should not be cached
-            body_mutation = '{"query": "mutation { createUser(name: \"test\") { id } }"}'
-            assert not cache._should_cache_request("POST", headers, body_mutation)
+        assert bool(cache._should_cache_request(method, headers, body)) is expected
 
     def test_cache_response_and_retrieval(self):
         """Test caching and retrieving responses."""
@@ -217,6 +260,56 @@ class TestResponseCache:
             assert cached_response.status_code == 200
             assert cached_response.text == '{"result": "success"}'
 
+    def test_cache_respects_server_directives(self):
+        """Test that Cache-Control/Expires drive TTL and no-store skips caching."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = CacheConfig(cache_dir=temp_dir, default_ttl=3600)
+            cache = ResponseCache(config)
+
+            def cache_with(url, headers):
+                cache.cache_response(_get_response(url, headers=headers))
+
+            cache_with("https://example.com/a", {"Cache-Control": "public, max-age=60"})
+            cache_with("https://example.com/b", {"Cache-Control": "no-store"})
+            cache_with("https://example.com/c", {"Expires": "0"})
+            cache_with("https://example.com/d", {})
+            cache_with(
+                "https://example.com/e", {"Cache-Control": "max-age=60, no-cache"}
+            )
+            cache_with("https://example.com/f", {"Pragma": "no-cache"})
+
+            ttls = {
+                info["url"]: info["expires_at"] - info["cached_at"]
+                for info in cache.index.values()
+            }
+            assert ttls == {
+                "https://example.com/a": 60,
+                "https://example.com/d": 3600,
+            }
+
+    def test_cache_skips_large_response_by_content_length(self, cache):
+        """Test that an oversized Content-Length skips caching unread bodies."""
+        response = httpx.Response(
+            status_code=200,
+            headers={"Content-Length": str(2 * 1024 * 1024)},
+            stream=httpx.ByteStream(b""),
+            request=httpx.Request("GET", "https://example.com/big"),
+        )
+        cache.cache_response(response)
+        assert not cache.index
+
+    def test_cache_measures_decoded_size_of_encoded_response(self, cache):
+        """Test that a gzip Content-Length does not hide a large decoded body."""
+        payload = gzip.compress(b"x" * (2 * 1024 * 1024))
+        response = httpx.Response(
+            status_code=200,
+            headers={"Content-Encoding": "gzip", "Content-Length": str(len(payload))},
+            content=payload,
+            request=httpx.Request("GET", "https://example.com/gz"),
+        )
+        cache.cache_response(response)
+        assert not cache.index
+
     def test_cache_expiration(self):
         """Test cache expiration."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -224,13 +317,7 @@ class TestResponseCache:
             cache = ResponseCache(config)
             
             # Create and cache response
-            request = httpx.Request("GET", "https://example.com")
-            response = httpx.Response(
-                status_code=200,
-                content=b"test",
-                request=request
-            )
-            cache.cache_response(response)
+            cache.cache_response(_get_response("https://example.com"))
             
             # Should be available immediately
             cached_response = cache.get_cached_response("GET", "https://example.com")
@@ -251,64 +338,71 @@ class TestResponseCache:
             
             # Add more entries than max_entries
             for i in range(3):
-                request = httpx.Request("GET", f"https://example{i}.com")
-                response = httpx.Response(
-                    status_code=200,
-                    content=f"response{i}".encode(),
-                    request=request
+                cache.cache_response(
+                    _get_response(f"https://example{i}.com", f"response{i}".encode())
                 )
-                cache.cache_response(response)
             
             # Should have only max_entries entries
             assert len(cache.index) <= config.max_entries
 
-    def test_clear_cache(self):
-        """Test clearing cache."""
+    def test_cache_evicts_least_recently_used(self):
+        """Test that a cache hit protects an entry from eviction."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            config = CacheConfig(cache_dir=temp_dir)
-            cache = ResponseCache(config)
-            
-            # Add some entries
-            request = httpx.Request("GET", "https://example.com")
-            response = httpx.Response(
-                status_code=200,
-                content=b"test",
-                request=request
-            )
-            cache.cache_response(response)
-            assert len(cache.index) > 0
-            
-            # Clear cache
-            cache.clear_cache()
-            assert len(cache.index) == 0
+            cache = ResponseCache(CacheConfig(cache_dir=temp_dir, max_entries=2))
+
+            cache.cache_response(_get_response("https://example.com/0"))
+            cache.cache_response(_get_response("https://example.com/1"))
+            assert cache.get_cached_response("GET", "https://example.com/0") is not None
+            cache.cache_response(_get_response("https://example.com/2"))
+
+            assert [info["url"] for info in cache.index.values()] == [
+                "https://example.com/0",
+                "https://example.com/2",
+            ]
 
-    def test_cache_stats(self):
+    def test_clear_cache(self, cache):
+        """Test clearing cache."""
+        # Add some entries
+        cache.cache_response(_get_response("https://example.com"))
+        assert len(cache.index) > 0
+        
+        # Clear cache
+        cache.clear_cache()
+        assert len(cache.index) == 0
+
+    def test_cache_stats(self, cache):
         """Test cache statistics."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = CacheConfig(cache_dir=temp_dir)
-            cache = ResponseCache(config)
-            
-            stats = cache.get_cache_stats()
-            assert "enabled" in stats
-            assert "total_entries" in stats
-            assert "total_size_mb" in stats
-            assert "cache_dir" in stats
-            assert "config" in stats
-            assert stats["enabled"] is True
-            assert stats["total_entries"] == 0
+        stats = cache.get_cache_stats()
+        assert "enabled" in stats
+        assert "total_entries" in stats
+        assert "total_size_mb" in stats
+        assert "cache_dir" in stats
+        assert "config" in stats
+        assert stats["enabled"] is True
+        assert stats["total_entries"] == 0
+
+
+@pytest.fixture
+def global_cache(monkeypatch, tmp_path):
+    """Isolate the module-level cache singleton; restored after the test."""
+    monkeypatch.setattr("talkie.utils.cache._global_cache", None)
+    set_cache_config(CacheConfig(cache_dir=str(tmp_path)))
+    return get_cache()
 
 
 class TestGlobalCache:
     """Test global cache functions."""
     
-    def test_get_cache(self):
+    def test_get_cache(self, global_cache):
         """Test getting global cache."""
         cache = get_cache()
         assert isinstance(cache, ResponseCache)
+        assert cache is global_cache
 
-    def test_set_cache_config(self):
+    @pytest.mark.usefixtures("global_cache")
+    def test_set_cache_config(self, tmp_path):
         """Test setting cache configuration."""
-        config = CacheConfig(enabled=False)
+        config = CacheConfig(enabled=False, cache_dir=str(tmp_path))
         set_cache_config(config)
         cache = get_cache()
         assert cache.config.enabled is False
\ No newline at end of file
@@ -8,8 +8,9 @@ from typer.testing import CliRunner
 from talkie.cli.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner() -> CliRunner:
+    # CliRunner keeps no per-invocation state, so one instance serves the module
     return CliRunner()
 
 
@@ -1,10 +1,25 @@
 """Tests for HTTP client."""
 
-import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
 import httpx
-from talkie.core.client import HttpClient
+import pytest
+
 from talkie.core.async_client import AsyncHttpClient
+from talkie.core.client import HttpClient, get_shared_client
+
+
+@pytest.fixture
+def stub_httpx():
+    """Stand in for httpx client classes in tests that stub .request anyway.
+
+    Building a real client creates an SSL context (tens of ms each); only the
+    context-manager tests need the real classes.
+    """
+    with patch("httpx.Client") as client_cls, patch("httpx.AsyncClient") as async_cls:
+        async_cls.return_value.aclose = AsyncMock()
+        yield client_cls, async_cls
 
 
 class TestHttpClient:
@@ -27,15 +42,17 @@ class TestHttpClient:
         # Client should be closed after context
         assert client.client is None
 
+    @pytest.mark.usefixtures("stub_httpx")
     def test_request_success(self):
         """Test successful HTTP request."""
         with HttpClient() as client:
             # Mock the httpx client
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.headers = {"Content-Type": "application/json"}
-            mock_response.text = '{"result": "success"}'
-            mock_response.elapsed = __import__("datetime").timedelta(milliseconds=50)
+            mock_response = SimpleNamespace(
+                status_code=200,
+                headers={"Content-Type": "application/json"},
+                text='{"result": "success"}',
+                elapsed=__import__("datetime").timedelta(milliseconds=50),
+            )
 
             client.client.request = Mock(return_value=mock_response)
             
@@ -52,14 +69,16 @@ class TestHttpClient:
         with pytest.raises(RuntimeError, match="Client not initialized"):
             client.request("GET", "https://example.com")
 
+    @pytest.mark.usefixtures("stub_httpx")
     def test_request_with_kwargs(self):
         """Test request with additional kwargs."""
         with HttpClient() as client:
-            mock_response = Mock()
-            mock_response.status_code = 201
-            mock_response.headers = {"Location": "https://example.com/resource/1"}
-            mock_response.text = '{"id": 1}'
-            mock_response.elapsed = __import__("datetime").timedelta(milliseconds=50)
+            mock_response = SimpleNamespace(
+                status_code=201,
+                headers={"Location": "https://example.com/resource/1"},
+                text='{"id": 1}',
+                elapsed=__import__("datetime").timedelta(milliseconds=50),
+            )
 
             client.client.request = Mock(return_value=mock_response)
             
@@ -82,6 +101,7 @@ class TestHttpClient:
                 headers={"Authorization": "Bearer token"}
             )
 
+    @pytest.mark.usefixtures("stub_httpx")
     def test_request_error_handling(self):
         """Test request error handling."""
         with HttpClient() as client:
@@ -91,6 +111,68 @@ class TestHttpClient:
             with pytest.raises(httpx.RequestError):
                 client.request("GET", "https://example.com")
 
+    def test_external_client_is_reused(self):
+        """Test that a supplied client is used per request and left open."""
+        shared = Mock(spec=httpx.Client)
+        mock_response = SimpleNamespace(
+            status_code=200,
+            headers={},
+            text="",
+            elapsed=None,
+        )
+        shared.request.return_value = mock_response
+
+        with HttpClient(timeout=5.0, follow_redirects=False, client=shared) as client:
+            assert client.client is shared
+            client.request("GET", "https://example.com")
+
+        shared.request.assert_called_once_with(
+            "GET",
+            "https://example.com",
+            timeout=httpx.Timeout(5.0),
+            follow_redirects=False,
+        )
+        shared.close.assert_not_called()
+        assert client.client is None
+
+    def test_per_request_timeout(self):
+        """Test that a per-call timeout is forwarded without touching the client."""
+        shared = Mock(spec=httpx.Client)
+        shared.request.return_value = SimpleNamespace(
+            status_code=200, headers={}, text="", elapsed=None
+        )
+
+        with HttpClient(timeout=5.0, client=shared) as client:
+            client.request("GET", "https://example.com", timeout=1.5)
+
+        shared.request.assert_called_once_with(
+            "GET",
+            "https://example.com",
+            timeout=httpx.Timeout(1.5),
+            follow_redirects=True,
+        )
+
+    def test_timeout_objects_are_reused(self):
+        """Test that equal per-call timeouts share one httpx.Timeout."""
+        shared = Mock(spec=httpx.Client)
+        shared.request.return_value = SimpleNamespace(
+            status_code=200, headers={}, text="", elapsed=None
+        )
+
+        with HttpClient(client=shared) as client:
+            client.request("GET", "https://example.com", timeout=2.5)
+            client.request("GET", "https://example.com", timeout=2.5)
+
+        calls = shared.request.call_args_list
+        first, second = (call.kwargs["timeout"] for call in calls)
+        assert first is second
+
+    def test_shared_client_is_singleton(self):
+        """Test that get_shared_client returns the same pooled client."""
+        assert get_shared_client() is get_shared_client()
+        assert get_shared_client(verify=False) is get_shared_client(verify=False)
+        assert get_shared_client(verify=False) is not get_shared_client()
+
 
 class TestAsyncHttpClient:
     """Test async HTTP client."""
@@ -114,14 +196,16 @@ class TestAsyncHttpClient:
         assert client.client is None
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("stub_httpx")
     async def test_async_request_success(self):
         """Test successful async HTTP request."""
         async with AsyncHttpClient() as client:
             # Mock the httpx async client
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.headers = {"Content-Type": "application/json"}
-            mock_response.text = '{"result": "success"}'
+            mock_response = SimpleNamespace(
+                status_code=200,
+                headers={"Content-Type": "application/json"},
+                text='{"result": "success"}',
+            )
             
             # Create async mock
             async def mock_request(*args, **kwargs):
@@ -135,6 +219,27 @@ class TestAsyncHttpClient:
             assert result["headers"]["Content-Type"] == "application/json"
             assert result["body"] == '{"result": "success"}'
 
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("stub_httpx")
+    async def test_async_get_and_post(self):
+        """Test the GET/POST shortcuts share one client."""
+        async with AsyncHttpClient() as client:
+            calls = []
+
+            async def mock_request(method, url, **kwargs):
+                calls.append((method, url, kwargs))
+                return SimpleNamespace(status_code=200, headers={}, text="")
+
+            client.client.request = mock_request
+
+            await client.get("https://example.com/a", timeout=2.0)
+            await client.post("https://example.com/b", json={"x": 1})
+
+        assert calls == [
+            ("GET", "https://example.com/a", {"timeout": httpx.Timeout(2.0)}),
+            ("POST", "https://example.com/b", {"json": {"x": 1}}),
+        ]
+
     @pytest.mark.asyncio
     async def test_async_request_without_context(self):
         """Test async request without context manager."""
@@ -144,13 +249,15 @@ class TestAsyncHttpClient:
             await client.request("GET", "https://example.com")
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("stub_httpx")
     async def test_async_request_with_kwargs(self):
         """Test async request with additional kwargs."""
         async with AsyncHttpClient() as client:
-            mock_response = Mock()
-            mock_response.status_code = 201
-            mock_response.headers = {"Location": "https://example.com/resource/1"}
-            mock_response.text = '{"id": 1}'
+            mock_response = SimpleNamespace(
+                status_code=201,
+                headers={"Location": "https://example.com/resource/1"},
+                text='{"id": 1}',
+            )
             
             # Create async mock
             async def mock_request(*args, **kwargs):
@@ -170,6 +277,7 @@ class TestAsyncHttpClient:
             assert result["body"] == '{"id": 1}'
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("stub_httpx")
     async def test_async_request_error_handling(self):
         """Test async request error handling."""
         async with AsyncHttpClient() as client:
@@ -185,14 +293,14 @@ class TestClientImports:
     
     def test_client_imports(self):
         """Test client imports."""
-        from talkie.core import HttpClient, AsyncHttpClient
+        from talkie.core import AsyncHttpClient, HttpClient
         assert HttpClient is not None
         assert AsyncHttpClient is not None
 
     def test_client_module_imports(self):
         """Test client module imports."""
-        from talkie.core.client import HttpClient
         from talkie.core.async_client import AsyncHttpClient
+        from talkie.core.client import HttpClient
         
         assert HttpClient is not None
         assert AsyncHttpClient is not None
@@ -102,7 +102,7 @@ class TestConfig:
                 assert isinstance(config, Config)
                 assert config.default_headers == {"User-Agent": f"Talkie/{__version__}"}
 
-    def test_config_load_from_file(self):
+    def test_config_load_from_file(self, tmp_path):
         """Test loading config from file."""
         config_data = {
             "default_headers": {"User-Agent": "Custom/1.0"},
@@ -115,38 +115,39 @@ class TestConfig:
             "active_environment": "test"
         }
         
+        temp_path = tmp_path / "config.json"
+        temp_path.write_text(json.dumps(config_data))
         with patch('talkie.utils.config.Config._get_config_path') as mock_path:
-            with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-                json.dump(config_data, temp_file)
-                temp_path = Path(temp_file.name)
-            
-            try:
-                mock_path.return_value = temp_path
-                config = Config.load_default()
-                
-                assert config.default_headers == {"User-Agent": "Custom/1.0"}
-                assert "test" in config.environments
-                assert config.active_environment == "test"
-            finally:
-                if temp_path.exists():
-                    temp_path.unlink()
-
-    def test_config_load_invalid_json(self):
+            mock_path.return_value = temp_path
+            config = Config.load_default()
+
+            assert config.default_headers == {"User-Agent": "Custom/1.0"}
+            assert "test" in config.environments
+            assert config.active_environment == "test"
+
+    def test_config_load_sees_file_changes(self):
+        """Test that a rewritten config file is re-read despite caching."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            with patch('talkie.utils.config.Config._get_config_path') as mock_path:
+                mock_path.return_value = config_path
+
+                config_path.write_text(json.dumps({"active_environment": "a"}))
+                assert Config.load_default().active_environment == "a"
+
+                config_path.write_text(json.dumps({"active_environment": "bb"}))
+                assert Config.load_default().active_environment == "bb"
+
+    def test_config_load_invalid_json(self, tmp_path):
         """Test loading config with invalid JSON."""
+        temp_path = tmp_path / "config.json"
+        temp_path.write_text("invalid json")
         with patch('talkie.utils.config.Config._get_config_path') as mock_path:
-            with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-                temp_file.write("invalid json")
-                temp_path = Path(temp_file.name)
-            
-            try:
-                mock_path.return_value = temp_path
-                config = Config.load_default()
-                
-                # Should return default config on error
-                assert isinstance(config, Config)
-            finally:
-                if temp_path.exists():
-                    temp_path.unlink()
+            mock_path.return_value = temp_path
+            config = Config.load_default()
+
+            # Should return default config on error
+            assert isinstance(config, Config)
 
 
 class TestConfigFunctions:
@@ -3,7 +3,7 @@
 import json
 import pytest
 from unittest.mock import Mock, patch
-from talkie.utils.formatter import DataFormatter
+from talkie.utils.formatter import DataFormatter, dump_json, load_json
 
 
 class TestDataFormatter:
@@ -186,3 +186,37 @@ class TestDataFormatter:
         assert formatter.html_converter.ignore_images is False
         assert formatter.html_converter.ignore_tables is False
         assert formatter.html_converter.body_width == 0
+
+
+class TestDumpJson:
+    """Test dump_json helper."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_matches_stdlib_output(self, use_orjson):
+        """Test that orjson and the stdlib fallback produce the same text."""
+        data = {"b": [1, 2.5, None], "a": {"имя": "значение"}, 3: True}
+        expected = json.dumps(data, indent=2, ensure_ascii=False, sort_keys=False)
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+            assert dump_json(data) == expected
+        else:
+            with patch("talkie.utils.formatter.orjson", None):
+                assert dump_json(data) == expected
+
+    def test_sort_keys_and_big_int(self):
+        """Test key sorting and integers orjson cannot encode."""
+        data = {"z": 2 ** 70, "a": 1}
+        assert dump_json(data, sort_keys=True) == json.dumps(
+            data, indent=2, sort_keys=True
+        )
+
+    def test_load_json_matches_stdlib(self):
+        """Test load_json on input orjson rejects and on invalid JSON."""
+        text = '{"big": 123456789012345678901234567890, "x": NaN}'
+        loaded = load_json(text)
+        assert loaded["big"] == 123456789012345678901234567890
+        assert loaded["x"] != loaded["x"]
+
+        with pytest.raises(json.JSONDecodeError):
+            load_json("<html>")
@@ -1,82 +1,43 @@
 """Tests for logger module."""
 
 import logging
-import tempfile
 import os
 from pathlib import Path
-from unittest.mock import patch, Mock
+from unittest.mock import Mock
 import pytest
 from talkie.utils.logger import setup_logging, get_logger, log_request, log_response, log_error
 
 
+@pytest.fixture
+def talkie_logger():
+    """The "talkie" logger; handlers added by the test are closed afterwards."""
+    logger = logging.getLogger("talkie")
+    yield logger
+    # Close all handlers to release file handles
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+
 class TestSetupLogging:
     """Test logging setup."""
     
-    def test_setup_logging_default(self):
-        """Test default logging setup."""
-        setup_logging()
-        
-        logger = logging.getLogger("talkie")
-        assert logger.level == logging.INFO
-        assert len(logger.handlers) == 0  # No handlers by default
-
-    def test_setup_logging_verbose(self):
-        """Test logging setup with verbose output."""
-        setup_logging(verbose=True)
-        
-        logger = logging.getLogger("talkie")
-        assert logger.level == logging.INFO
-        assert len(logger.handlers) == 1  # Console handler added
-
-    def test_setup_logging_with_file(self):
-        """Test logging setup with file output."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        try:
-            setup_logging(log_file=temp_path)
-            
-            logger = logging.getLogger("talkie")
-            assert logger.level == logging.INFO
-            assert len(logger.handlers) == 1  # File handler added
-            
-            # Check that file exists
-            assert os.path.exists(temp_path)
-        finally:
-            # Close all handlers to release file handles
-            for handler in logger.handlers[:]:
-                handler.close()
-                logger.removeHandler(handler)
-            if os.path.exists(temp_path):
-                try:
-                    os.unlink(temp_path)
-                except PermissionError:
-                    pass  # File might be locked, ignore
-
-    def test_setup_logging_verbose_and_file(self):
-        """Test logging setup with both verbose and file output."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        try:
-            setup_logging(verbose=True, log_file=temp_path)
-            
-            logger = logging.getLogger("talkie")
-            assert logger.level == logging.INFO
-            assert len(logger.handlers) == 2  # Both console and file handlers
-            
-            # Check that file exists
-            assert os.path.exists(temp_path)
-        finally:
-            # Close all handlers to release file handles
-            for handler in logger.handlers[:]:
-                handler.close()
-                logger.removeHandler(handler)
-            if os.path.exists(temp_path):
-                try:
-                    os.unlink(temp_path)
-                except PermissionError:
-                    pass  # File might be locked, ignore
+    @pytest.mark.parametrize(
+        "verbose,use_file,expected_handlers",
+        [(False, False, 0), (True, False, 1), (False, True, 1), (True, True, 2)],
+        ids=["default", "verbose", "file", "verbose-and-file"],
+    )
+    def test_setup_logging_handler_count(
+        self, talkie_logger, tmp_path, verbose, use_file, expected_handlers
+    ):
+        """Test that console and file handlers are added only when requested."""
+        log_file = str(tmp_path / "talkie.log") if use_file else None
+        setup_logging(verbose=verbose, log_file=log_file)
+
+        assert talkie_logger.level == logging.INFO
+        assert len(talkie_logger.handlers) == expected_handlers
+        if log_file:
+            assert os.path.exists(log_file)
 
     def test_setup_logging_different_levels(self):
         """Test logging setup with different levels."""
@@ -106,170 +67,118 @@ class TestGetLogger:
         logger = get_logger()
         assert isinstance(logger, logging.Logger)
         assert logger.name == "talkie"
+        assert get_logger() is logger
 
-    def test_get_logger_same_instance(self):
-        """Test that get_logger returns same instance."""
-        logger1 = get_logger()
-        logger2 = get_logger()
-        assert logger1 is logger2
+
+@pytest.fixture
+def mock_logger(monkeypatch):
+    """Replace the module logger used by the log_* helpers."""
+    logger = Mock()
+    monkeypatch.setattr("talkie.utils.logger.logger", logger)
+    return logger
 
 
 class TestLogRequest:
     """Test request logging."""
 
-    def test_log_request_basic(self):
-        """Test basic request logging."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            log_request("GET", "https://example.com", headers={})
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args[0]
-            assert call_args[1] == "GET"
-            assert call_args[2] == "https://example.com"
-
-    def test_log_request_with_headers(self):
-        """Test request logging with headers."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            headers = {"Authorization": "Bearer token", "Content-Type": "application/json"}
-            log_request("POST", "https://example.com", headers=headers)
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args[0]
-            assert call_args[1] == "POST"
-            assert call_args[2] == "https://example.com"
-
-    def test_log_request_with_body(self):
-        """Test request logging with data (body)."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            data = {"name": "test"}
-            log_request("POST", "https://example.com", headers={}, data=data)
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args[0]
-            assert call_args[1] == "POST"
-            assert call_args[2] == "https://example.com"
-
-    def test_log_request_with_all_params(self):
-        """Test request logging with all parameters."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            headers = {"Content-Type": "application/json"}
-            data = {"name": "test"}
-            log_request("POST", "https://example.com", headers=headers, data=data)
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args[0]
-            assert call_args[1] == "POST"
-            assert call_args[2] == "https://example.com"
+    @pytest.mark.parametrize(
+        "method,kwargs",
+        [
+            ("GET", {"headers": {}}),
+            (
+                "POST",
+                {
+                    "headers": {
+                        "Authorization": "Bearer token",
+                        "Content-Type": "application/json",
+                    }
+                },
+            ),
+            ("POST", {"headers": {}, "data": {"name": "test"}}),
+            (
+                "POST",
+                {
+                    "headers": {"Content-Type": "application/json"},
+                    "data": {"name": "test"},
+                },
+            ),
+        ],
+        ids=["basic", "headers", "body", "all-params"],
+    )
+    def test_log_request(self, mock_logger, method, kwargs):
+        """Test that method and URL are logged."""
+        log_request(method, "https://example.com", **kwargs)
+        mock_logger.info.assert_called_once()
+        call_args = mock_logger.info.call_args[0]
+        assert call_args[1] == method
+        assert call_args[2] == "https://example.com"
 
 
 class TestLogResponse:
     """Test response logging."""
 
-    def test_log_response_basic(self):
-        """Test basic response logging."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            log_response(200, {}, 1024)
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args[0]
-            assert call_args[1] == 200
-
-    def test_log_response_with_headers(self):
-        """Test response logging with headers."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            headers = {"Content-Type": "application/json", "X-Custom": "value"}
-            log_response(200, headers, 2048)
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args[0]
-            assert call_args[1] == 200
-
-    def test_log_response_error_status(self):
-        """Test response logging with error status."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            log_response(404, {}, 0)
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args[0]
-            assert call_args[1] == 404
+    @pytest.mark.parametrize(
+        "status,headers,size",
+        [
+            (200, {}, 1024),
+            (200, {"Content-Type": "application/json", "X-Custom": "value"}, 2048),
+            (404, {}, 0),
+        ],
+        ids=["basic", "headers", "error-status"],
+    )
+    def test_log_response(self, mock_logger, status, headers, size):
+        """Test that the status code is logged."""
+        log_response(status, headers, size)
+        mock_logger.info.assert_called_once()
+        call_args = mock_logger.info.call_args[0]
+        assert call_args[1] == status
 
 
 class TestLogError:
     """Test error logging."""
 
-    def test_log_error_basic(self):
-        """Test basic error logging."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            log_error("Test error")
-            mock_logger.error.assert_called_once()
-            call_args = mock_logger.error.call_args[0][0]
-            assert "Test error" in call_args
-
-    def test_log_error_with_message(self):
-        """Test error logging with custom message."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            error = Exception("Test error")
-            log_error("Custom error message", exception=error)
-            mock_logger.error.assert_called_once()
-            call_args = mock_logger.error.call_args[0][0]
-            assert "Custom error message" in call_args
-            assert "Test error" in call_args
-
-    def test_log_error_with_exception(self):
-        """Test error logging with exception."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            error = Exception("Test error")
-            log_error("Request failed", exception=error)
-            mock_logger.error.assert_called_once()
-            call_args = mock_logger.error.call_args[0][0]
-            assert "Request failed" in call_args
-            assert "Test error" in call_args
-
-    def test_log_error_different_types(self):
-        """Test error logging with different error types."""
-        with patch('talkie.utils.logger.logger') as mock_logger:
-            # Test with ValueError
-            error = ValueError("Invalid value")
-            log_error("Validation failed", exception=error)
-            mock_logger.error.assert_called()
-
-            # Test with RuntimeError
-            mock_logger.reset_mock()
-            error = RuntimeError("Runtime error")
-            log_error("Runtime failed", exception=error)
-            mock_logger.error.assert_called()
+    @pytest.mark.parametrize(
+        "message,exception",
+        [
+            ("Test error", None),
+            ("Custom error message", Exception("Test error")),
+            ("Validation failed", ValueError("Invalid value")),
+            ("Runtime failed", RuntimeError("Runtime error")),
+        ],
+        ids=["basic", "exception", "value-error", "runtime-error"],
+    )
+    def test_log_error(self, mock_logger, message, exception):
+        """Test that the message and any exception text are logged."""
+        log_error(message, exception=exception)
+        mock_logger.error.assert_called_once()
+        call_args = mock_logger.error.call_args[0][0]
+        assert message in call_args
+        if exception is not None:
+            assert str(exception) in call_args
 
 
 class TestLoggingIntegration:
     """Test logging integration."""
     
-    def test_logging_workflow(self):
+    def test_logging_workflow(self, talkie_logger, tmp_path):
         """Test complete logging workflow."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        try:
-            # Setup logging
-            setup_logging(verbose=True, log_file=temp_path)
-            logger = get_logger()
-            
-            # Test that logger is properly configured
-            assert logger.name == "talkie"
-            assert logger.level == logging.INFO
-            
-            # Test logging different types of messages
-            log_request("GET", "https://example.com", headers={})
-            log_response(200, {}, 1024)
-            log_error("Test error", exception=Exception("Test error"))
-            
-            # Check that log file was created and has content
-            assert os.path.exists(temp_path)
-            with open(temp_path, 'r') as f:
-                content = f.read()
-                assert "GET" in content
-                assert "200" in content
-                assert "Test error" in content
-                
-        finally:
-            # Close all handlers to release file handles
-            for handler in logger.handlers[:]:
-                handler.close()
-                logger.removeHandler(handler)
-            if os.path.exists(temp_path):
-                try:
-                    os.unlink(temp_path)
-                except PermissionError:
-                    pass  # File might be locked, ignore
+        temp_path = str(tmp_path / "talkie.log")
+        # Setup logging
+        setup_logging(verbose=True, log_file=temp_path)
+        logger = get_logger()
+
+        # Test that logger is properly configured
+        assert logger is talkie_logger
+        assert logger.level == logging.INFO
+
+        # Test logging different types of messages
+        log_request("GET", "https://example.com", headers={})
+        log_response(200, {}, 1024)
+        log_error("Test error", exception=Exception("Test error"))
+
+        # Check that log file was created and has content
+        assert os.path.exists(temp_path)
+        content = Path(temp_path).read_text()
+        assert "GET" in content
+        assert "200" in content
+        assert "Test error" in content
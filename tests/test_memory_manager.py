@@ -0,0 +1,187 @@
+"""Tests for memory manager."""
+
+import asyncio
+import gc
+import threading
+
+import pytest
+
+from talkie.utils.memory_manager import MemoryManager, MemoryStats
+from talkie.utils.performance_config import (
+    PerformanceConfig,
+    reset_performance_config,
+    set_performance_config,
+)
+
+
+@pytest.fixture
+def manager_factory():
+    """Build MemoryManager instances with a custom performance config."""
+
+    def make(**config_fields) -> MemoryManager:
+        set_performance_config(PerformanceConfig(**config_fields))
+        return MemoryManager()
+
+    yield make
+    reset_performance_config()
+
+
+class TestMemoryManager:
+    """Test memory manager."""
+
+    def test_get_current_stats(self, manager_factory):
+        """Test that a snapshot has the expected field types."""
+        stats = manager_factory().get_current_stats()
+        assert isinstance(stats, MemoryStats)
+        assert isinstance(stats.current_mb, float)
+        assert isinstance(stats.gc_count, int)
+
+    def test_gc_count_tracks_collections(self, manager_factory):
+        """Test that gc_count counts collections, even without psutil."""
+        manager = manager_factory(memory_stats_ttl_ms=0)
+        before = manager.get_current_stats().gc_count
+        gc.collect()
+        assert manager.get_current_stats().gc_count > before
+
+    def test_stats_are_reused_within_ttl(self, manager_factory):
+        """Test that repeated reads inside the TTL share one probe."""
+        manager = manager_factory(memory_stats_ttl_ms=60_000)
+        assert manager.get_current_stats() is manager.get_current_stats()
+
+    def test_zero_ttl_probes_every_call(self, manager_factory):
+        """Test that a zero TTL disables the snapshot cache."""
+        manager = manager_factory(memory_stats_ttl_ms=0)
+        assert manager.get_current_stats() is not manager.get_current_stats()
+
+    def test_history_is_bounded(self, manager_factory):
+        """Test that only the last stats_window_size samples are kept."""
+        manager = manager_factory(stats_window_size=3)
+        for current_mb in (5.0, 9.0, 4.0, 6.0, 7.0):
+            manager._record(MemoryStats(current_mb, current_mb, 0.0, 0.0, 0, 0.0))
+
+        assert [stats.current_mb for stats in manager.get_history()] == [4.0, 6.0, 7.0]
+        assert manager.get_peak_memory() == 9.0
+        assert manager.get_stats_summary()["peak_memory_mb"] == 9.0
+
+    def test_summary_does_not_wait_for_writer(self, manager_factory):
+        """Test that a held lock yields the previous summary instead of blocking."""
+        manager = manager_factory()
+        manager._record(manager.get_current_stats())
+        first = manager.get_stats_summary()
+
+        with manager._lock:
+            assert manager.get_stats_summary() == first
+
+    @pytest.mark.asyncio
+    async def test_start_async_samples_on_loop(self, manager_factory):
+        """Test that event-loop monitoring samples without a thread."""
+        manager = manager_factory()
+        samples = []
+        manager.add_callback(samples.append)
+
+        manager.start_async()
+        try:
+            await asyncio.sleep(0)
+            assert manager._monitor_thread is None
+            assert len(samples) == 1
+        finally:
+            manager.stop_monitoring()
+        assert manager._monitor_timer is None
+
+    def test_start_async_without_loop_uses_thread(self, manager_factory):
+        """Test that start_async falls back to thread mode outside a loop."""
+        manager = manager_factory()
+        delivered = threading.Event()
+        manager.add_callback(lambda stats: delivered.set())
+        manager.start_async()
+        try:
+            assert manager._monitor_thread is not None
+            assert manager.wait_for_sample(timeout=5.0)
+            assert manager.get_history()
+            # Callbacks run on the dispatcher thread, not the sampler
+            assert delivered.wait(timeout=5.0)
+        finally:
+            manager.stop_monitoring()
+        assert not manager._monitor_thread.is_alive()
+        assert not manager._dispatch_thread.is_alive()
+
+    def test_wait_for_sample_resets_on_restart(self, manager_factory, monkeypatch):
+        """Test that a restarted monitor waits for a fresh sample."""
+        manager = manager_factory()
+        manager._first_sample.set()  # left over from an earlier run
+        monkeypatch.setattr(manager, "_sample_once", manager._stop_event.wait)
+        manager.start_monitoring()
+        try:
+            assert not manager.wait_for_sample(timeout=0.05)
+        finally:
+            manager.stop_monitoring()
+
+    def test_callback_queue_drops_oldest(self, manager_factory):
+        """Test that undelivered samples are bounded by callback_queue_max."""
+        manager = manager_factory(callback_queue_max=2)
+        for current_mb in (1.0, 2.0, 3.0):
+            manager._enqueue(MemoryStats(current_mb, current_mb, 0.0, 0.0, 0, 0.0))
+        assert [stats.current_mb for stats in manager._pending] == [2.0, 3.0]
+
+    def test_callbacks_are_replaced_not_mutated(self, manager_factory):
+        """Test that registration swaps the callback tuple the sampler reads."""
+        manager = manager_factory()
+        first, second = [], []
+        manager.add_callback(first.append)
+        snapshot = manager._callbacks
+        manager.add_callback(second.append)
+        manager.remove_callback(first.append)
+
+        assert snapshot == (first.append,)
+        assert manager._callbacks == (second.append,)
+
+    def test_memory_limit_fast_path(self, manager_factory, monkeypatch):
+        """Test that a peak RSS under the limit skips the stats probe."""
+        manager = manager_factory(max_memory_usage_mb=100.0)
+        monkeypatch.setattr("talkie.utils.memory_manager._peak_rss_mb", lambda: 50.0)
+        monkeypatch.setattr(manager, "get_current_stats", pytest.fail)
+        assert manager.check_memory_limit() is False
+
+    def test_memory_limit_falls_back_to_probe(self, manager_factory, monkeypatch):
+        """Test that a high peak defers to the current RSS."""
+        manager = manager_factory(max_memory_usage_mb=100.0)
+        monkeypatch.setattr("talkie.utils.memory_manager._peak_rss_mb", lambda: 150.0)
+        monkeypatch.setattr(
+            manager,
+            "get_current_stats",
+            lambda: MemoryStats(120.0, 150.0, 0.0, 0.0, 0, 0.0),
+        )
+        assert manager.check_memory_limit() is True
+
+    def test_optimize_memory_rechecks_after_gc(self, manager_factory, monkeypatch):
+        """Test that the limit is re-probed after each collection, not cached."""
+        manager = manager_factory(
+            max_memory_usage_mb=100.0, log_performance_metrics=False
+        )
+        monkeypatch.setattr("talkie.utils.memory_manager._peak_rss_mb", lambda: 150.0)
+        collections = []
+        monkeypatch.setattr(
+            gc, "collect", lambda generation=2: collections.append(generation) or 0
+        )
+
+        def probe():
+            current_mb = 80.0 if collections else 120.0
+            return MemoryStats(current_mb, current_mb, 0.0, 0.0, 0, 0.0)
+
+        monkeypatch.setattr(manager, "_probe_stats", probe)
+        manager.optimize_memory()
+        assert collections == [2]
+
+    def test_optimize_memory_under_limit_is_noop(self, manager_factory, monkeypatch):
+        """Test that no collection runs while usage is under the limit."""
+        manager = manager_factory(max_memory_usage_mb=1_000_000.0)
+        collections = []
+        monkeypatch.setattr(gc, "collect", lambda *args: collections.append(args) or 0)
+
+        manager.optimize_memory()
+        assert not collections
+
+    def test_negative_ttl_rejected(self):
+        """Test that a negative TTL fails validation."""
+        with pytest.raises(ValueError, match="memory_stats_ttl_ms"):
+            PerformanceConfig(memory_stats_ttl_ms=-1).validate()
@@ -0,0 +1,42 @@
+"""Tests for performance configuration."""
+
+from dataclasses import fields
+
+import pytest
+
+from talkie.utils.performance_config import PerformanceConfig
+
+
+class TestPerformanceConfig:
+    """Test PerformanceConfig."""
+
+    def test_to_dict_covers_every_field(self):
+        """Test that to_dict lists every field in declaration order."""
+        config = PerformanceConfig(batch_size=7)
+        data = config.to_dict()
+        assert list(data) == [field.name for field in fields(PerformanceConfig)]
+        assert data["batch_size"] == 7
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("true", True),
+            ("1", True),
+            (" Yes ", True),
+            ("on", True),
+            ("Y", True),
+            ("false", False),
+            ("0", False),
+            ("off", False),
+            ("", False),
+        ],
+    )
+    def test_from_env_booleans(self, monkeypatch, value, expected):
+        """Test the accepted spellings of boolean environment variables."""
+        monkeypatch.setenv("TALKIE_HTTP2", value)
+        assert PerformanceConfig.from_env().enable_http2 is expected
+
+    def test_from_env_boolean_default(self, monkeypatch):
+        """Test that unset boolean variables default to enabled."""
+        monkeypatch.delenv("TALKIE_CACHE_ENABLED", raising=False)
+        assert PerformanceConfig.from_env().cache_enabled is True
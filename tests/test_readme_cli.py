@@ -3,19 +3,33 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import patch
+import os
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 from typer.testing import CliRunner
 
+from talkie.__version__ import __version__
 from talkie.cli.main import app
 from talkie.utils.history import reset_history_manager
 
 pytest_httpserver = pytest.importorskip("pytest_httpserver")
 HTTPServer = pytest_httpserver.HTTPServer
 
+pytestmark = pytest.mark.integration
+
+
+# Minimal OpenAPI document shared by the spec-reading tests
+_DEMO_SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Demo", "version": "1.0"},
+    "paths": {"/hello": {"get": {"summary": "Say hi"}}},
+}
+_DEMO_SPEC_JSON = json.dumps(_DEMO_SPEC)
+
 
 def _out(result) -> str:
     """Cross-version CliRunner output helper (stdout/stderr mixing differs by Click)."""
@@ -25,26 +39,26 @@ def _out(result) -> str:
     return result.stdout
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner() -> CliRunner:
+    # CliRunner keeps no per-invocation state, so one instance serves the module
     return CliRunner()
 
 
 @pytest.fixture
-def talkie_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("TALKIE_CONFIG_DIR", str(tmp_path))
-    monkeypatch.setenv("TALKIE_HISTORY_FILE", str(tmp_path / "history.json"))
+def talkie_env(temp_config_dir: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    history_file = Path(temp_config_dir) / "history.json"
+    monkeypatch.setenv("TALKIE_HISTORY_FILE", str(history_file))
     reset_history_manager()
     yield
     reset_history_manager()
 
 
 @pytest.fixture
-def http_srv() -> HTTPServer:
-    srv = HTTPServer()
-    srv.start()
-    yield srv
-    srv.stop()
+def http_srv(mock_server: HTTPServer) -> HTTPServer:
+    # One listening server per session (conftest); tests only get fresh expectations
+    yield mock_server
+    mock_server.clear()
 
 
 def test_readme_get_json(runner: CliRunner, talkie_env: None, http_srv: HTTPServer) -> None:
@@ -102,6 +116,47 @@ def test_readme_parallel_file(
     rout = _out(r)
     assert r.exit_code == 0, rout
     assert "200" in rout
+    assert "3 requests" in rout and "200: 3" in rout
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_readme_parallel_file_from_pipe(
+    runner: CliRunner, talkie_env: None, http_srv: HTTPServer, tmp_path: Path
+) -> None:
+    # A pipe can only be read once, like `talkie parallel -f <(gen)`
+    http_srv.expect_request("/a", method="GET").respond_with_data("A")
+    fifo = tmp_path / "req.fifo"
+    os.mkfifo(fifo)
+    lines = f"GET {http_srv.url_for('/a')}\nGET {http_srv.url_for('/a')}\n"
+
+    def feed() -> None:
+        with fifo.open("w", encoding="utf-8") as fh:
+            fh.write(lines)
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    r = runner.invoke(app, ["parallel", "-f", str(fifo)])
+    writer.join(timeout=5)
+    rout = _out(r)
+    assert r.exit_code == 0, rout
+    assert "2 requests" in rout and "200: 2" in rout
+
+
+def test_readme_parallel_bad_line_exits(
+    runner: CliRunner, talkie_env: None, http_srv: HTTPServer, tmp_path: Path
+) -> None:
+    http_srv.expect_request("/p", method="POST").respond_with_json({})
+    f = tmp_path / "req.txt"
+    f.write_text(
+        f"POST {http_srv.url_for('/p')} n:=1\n" * 20 + "GET https://example.com oops\n",
+        encoding="utf-8",
+    )
+    seen = len(http_srv.log)
+    r = runner.invoke(app, ["parallel", "-f", str(f), "--concurrency", "2"])
+    assert r.exit_code == 2, _out(r)
+    assert "Bad line" in _out(r)
+    # The whole file is validated before the first request goes out
+    assert len(http_srv.log) == seen
 
 
 def test_readme_curl_generate(runner: CliRunner, talkie_env: None) -> None:
@@ -122,6 +177,13 @@ def test_readme_curl_generate(runner: CliRunner, talkie_env: None) -> None:
     assert "example.com" in out
 
 
+def test_readme_curl_keeps_brackets(runner: CliRunner, talkie_env: None) -> None:
+    r = runner.invoke(app, ["curl", "https://example.com/api", "-H", "X-Tag: [b]v"])
+    out = _out(r)
+    assert r.exit_code == 0, out
+    assert "X-Tag: [b]v" in out
+
+
 def test_readme_format_json(tmp_path: Path, runner: CliRunner) -> None:
     p = tmp_path / "t.json"
     p.write_text('{"z":1,"a":2}', encoding="utf-8")
@@ -132,19 +194,60 @@ def test_readme_format_json(tmp_path: Path, runner: CliRunner) -> None:
 
 
 def test_readme_openapi_local_file(tmp_path: Path, runner: CliRunner) -> None:
-    spec = {
-        "openapi": "3.0.0",
-        "info": {"title": "Demo", "version": "1.0"},
-        "paths": {"/hello": {"get": {"summary": "Say hi"}}},
-    }
     p = tmp_path / "api.yaml"
-    p.write_text(yaml.dump(spec), encoding="utf-8")
+    p.write_text(yaml.dump(_DEMO_SPEC), encoding="utf-8")
     r = runner.invoke(app, ["openapi", str(p), "--endpoints"])
     out = _out(r)
     assert r.exit_code == 0, out
     assert "/hello" in out
 
 
+@pytest.fixture(scope="module")
+def generated_client(
+    tmp_path_factory: pytest.TempPathFactory, runner: CliRunner
+) -> tuple[Path, str]:
+    # Generation is deterministic for a fixed spec, so it runs once per module
+    tmp_path = tmp_path_factory.mktemp("generate-client")
+    p = tmp_path / "api.json"
+    p.write_text(_DEMO_SPEC_JSON, encoding="utf-8")
+    dest = tmp_path / "client"
+    r = runner.invoke(app, ["generate-client", str(p), "-o", str(dest)])
+    out = _out(r)
+    assert r.exit_code == 0, out
+    return dest, out
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "name", ["__init__.py", "apiclient.py", "models.py", "README.md"]
+)
+def test_readme_generate_client_files(
+    generated_client: tuple[Path, str], name: str
+) -> None:
+    dest, out = generated_client
+    assert (dest / name).is_file()
+    assert name in out
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "name, snippet",
+    [("apiclient.py", "class ApiClient"), ("apiclient.py", "def get_hello"),
+     ("models.py", "class BaseResponse")],
+)
+def test_readme_generate_client_content(
+    generated_client: tuple[Path, str], name: str, snippet: str
+) -> None:
+    dest, _ = generated_client
+    assert snippet in (dest / name).read_text(encoding="utf-8")
+
+
+@pytest.mark.slow
+def test_readme_generate_client_summary(generated_client: tuple[Path, str]) -> None:
+    _, out = generated_client
+    assert "get_hello" in out
+
+
 def test_readme_graphql_local(
     runner: CliRunner, talkie_env: None, http_srv: HTTPServer
 ) -> None:
@@ -190,6 +293,19 @@ def test_readme_headers_query_and_output_file(
     assert "ok" in out_file.read_text(encoding="utf-8")
 
 
+def test_output_file_keeps_binary_body(
+    runner: CliRunner, talkie_env: None, http_srv: HTTPServer, tmp_path: Path
+) -> None:
+    payload = b"\x89PNG\r\n\x1a\n\xff\x00"
+    http_srv.expect_request("/logo.png").respond_with_data(
+        payload, content_type="image/png"
+    )
+    out_file = tmp_path / "logo.png"
+    r = runner.invoke(app, ["get", http_srv.url_for("/logo.png"), "-o", str(out_file)])
+    assert r.exit_code == 0, _out(r)
+    assert out_file.read_bytes() == payload
+
+
 def test_readme_output_modes_verbose_headers_and_format(
     runner: CliRunner, talkie_env: None, http_srv: HTTPServer
 ) -> None:
@@ -384,3 +500,48 @@ def test_readme_parallel_output_dir_and_base_urls(
     assert r.exit_code == 0, _out(r)
     files = list(out_dir.glob("resp_*.txt"))
     assert files
+
+
+def test_readme_parallel_output_jsonl(
+    runner: CliRunner, talkie_env: None, http_srv: HTTPServer, tmp_path: Path
+) -> None:
+    http_srv.expect_request("/users/1", method="GET").respond_with_data("u1")
+    http_srv.expect_request("/users/2", method="GET").respond_with_data("u2")
+    out_dir = tmp_path / "results"
+    r = runner.invoke(
+        app,
+        [
+            "parallel",
+            "-u",
+            "/users/1",
+            "-u",
+            "/users/2",
+            "-b",
+            http_srv.url_for(""),
+            "--output-dir",
+            str(out_dir),
+            "--output-format",
+            "jsonl",
+        ],
+    )
+    assert r.exit_code == 0, _out(r)
+    assert not list(out_dir.glob("resp_*.txt"))
+    rows = [
+        json.loads(line)
+        for line in (out_dir / "results.jsonl").read_text(encoding="utf-8").splitlines()
+    ]
+    assert sorted(row["body"] for row in rows) == ["u1", "u2"]
+    assert {row["status"] for row in rows} == {200}
+
+
+def test_readme_parallel_sends_config_headers(
+    runner: CliRunner, talkie_env: None, http_srv: HTTPServer
+) -> None:
+    http_srv.expect_request(
+        "/h", method="GET", headers={"User-Agent": f"Talkie/{__version__}"}
+    ).respond_with_data("ok")
+    url = http_srv.url_for("/h")
+    r = runner.invoke(app, ["parallel", "-u", url, "-u", url])
+    rout = _out(r)
+    assert r.exit_code == 0, rout
+    assert "200: 2" in rout
@@ -0,0 +1,67 @@
+"""Tests for input validators."""
+
+import pytest
+
+from talkie.utils.validators import InputValidator, ValidationError
+
+
+class TestPairParsing:
+    """Test key/value parsing of headers, query and data params."""
+
+    def test_headers(self):
+        """Test header parsing splits on the first colon and strips."""
+        assert InputValidator.validate_headers([" Accept : a:b ", "X-Empty:"]) == {
+            "Accept": "a:b",
+            "X-Empty": "",
+        }
+
+    @pytest.mark.parametrize("header", [":value", "no-colon", "a:b\nc"])
+    def test_invalid_headers(self, header):
+        """Test malformed headers are rejected."""
+        with pytest.raises(ValidationError, match="Invalid header format"):
+            InputValidator.validate_headers([header])
+
+    def test_query_params(self):
+        """Test query parsing splits on the first equals sign."""
+        assert InputValidator.validate_query_params(["q=a=b", "page = 2"]) == {
+            "q": "a=b",
+            "page": "2",
+        }
+
+    def test_data_params(self):
+        """Test JSON and form items are told apart."""
+        form, data = InputValidator.validate_data_params(
+            ["name=x", "n:=12", "ok:=TRUE", "none:=null", "a:b:=1"]
+        )
+        assert data == {"n": 12, "ok": True, "none": None}
+        # A colon in the key rules out key:=value, so it is a form field
+        assert form == {"name": "x", "a:b:": "1"}
+
+    def test_invalid_data_param(self):
+        """Test items without a separator are rejected."""
+        with pytest.raises(ValidationError, match="Invalid data format"):
+            InputValidator.validate_data_params(["novalue"])
+
+
+class TestChoiceValidators:
+    """Test HTTP method and output format validation."""
+
+    @pytest.mark.parametrize("method", ["get", "GET", "Get"])
+    def test_http_method_is_uppercased(self, method):
+        """Test any casing of a known method is accepted."""
+        assert InputValidator.validate_http_method(method) == "GET"
+
+    def test_invalid_http_method(self):
+        """Test unknown methods are reported in uppercase."""
+        with pytest.raises(ValidationError, match="Invalid HTTP method: 'FETCH'"):
+            InputValidator.validate_http_method("fetch")
+
+    @pytest.mark.parametrize("name", ["json", "JSON", "Json"])
+    def test_output_format_is_lowercased(self, name):
+        """Test any casing of a known format is accepted."""
+        assert InputValidator.validate_output_format(name) == "json"
+
+    def test_invalid_output_format(self):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValidationError, match="Invalid output format: 'yaml'"):
+            InputValidator.validate_output_format("YAML")
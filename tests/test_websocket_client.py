@@ -0,0 +1,82 @@
+"""Tests for WebSocket client."""
+
+import pytest
+
+from talkie.core.websocket_client import WebSocketClient
+
+websockets_server = pytest.importorskip("websockets.asyncio.server")
+
+
+async def _echo(ws):
+    async for frame in ws:
+        await ws.send(frame)
+
+
+async def _close_immediately(ws):
+    await ws.close()
+
+
+class TestWebSocketClient:
+    """Test WebSocket client against a local echo server."""
+
+    def test_unknown_framing(self):
+        """Test that an unknown framing is rejected."""
+        with pytest.raises(ValueError, match="framing"):
+            WebSocketClient("ws://127.0.0.1:1", framing="xml")
+
+    def test_late_handler_registration(self):
+        """Test that handlers added after earlier ones are dispatched too."""
+        client = WebSocketClient("ws://127.0.0.1:1")
+        first, second = [], []
+        client.on("message", first.append)
+        snapshot = client._frozen_handlers["message"]
+        client.on("message", second.append)
+
+        assert snapshot == (first.append,)
+        assert client._frozen_handlers["message"] == (first.append, second.append)
+
+    @pytest.mark.asyncio
+    async def test_json_round_trip(self):
+        """Test that structured payloads are framed and decoded as JSON."""
+        async with websockets_server.serve(_echo, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = WebSocketClient(f"ws://127.0.0.1:{port}")
+            received = []
+            client.on("message", received.append)
+
+            assert await client.connect()
+            try:
+                await client.send({"op": "ping", "n": 1})
+                message = await client.receive()
+                await client.send("plain text")
+                text = await client.receive()
+            finally:
+                await client.disconnect()
+
+        assert message.type == "json"
+        assert message.data == {"op": "ping", "n": 1}
+        assert text.type == "text"
+        assert text.data == "plain text"
+        assert received == [message, text]
+        assert not client.is_connected
+
+    @pytest.mark.asyncio
+    async def test_connect_failure(self):
+        """Test that a refused connection reports failure."""
+        client = WebSocketClient("ws://127.0.0.1:1")
+        assert not await client.connect()
+        assert await client.send("x") is False
+
+    @pytest.mark.asyncio
+    async def test_receive_after_server_close(self):
+        """Test that a server-side close ends receiving and marks it disconnected."""
+        serve = websockets_server.serve(_close_immediately, "127.0.0.1", 0)
+        async with serve as server:
+            port = server.sockets[0].getsockname()[1]
+            client = WebSocketClient(f"ws://127.0.0.1:{port}")
+            assert await client.connect()
+            try:
+                assert await client.receive() is None
+                assert not client.is_connected
+            finally:
+                await client.disconnect()
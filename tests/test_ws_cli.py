@@ -0,0 +1,120 @@
+"""CLI tests for `talkie ws` against a local WebSocket server."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from typer.testing import CliRunner
+
+from talkie.cli.main import app
+
+websockets_server = pytest.importorskip("websockets.asyncio.server")
+
+pytestmark = pytest.mark.integration
+
+
+# Frames the /record handler read, and a signal set once it has finished
+_recorded: list = []
+_record_done = threading.Event()
+
+
+async def _handler(ws) -> None:
+    path = ws.request.path
+    if path == "/record":
+        # Buffered frames are still delivered after the client's close
+        async for frame in ws:
+            _recorded.append(frame)
+        _record_done.set()
+    elif path == "/echo":
+        async for frame in ws:
+            await ws.send(frame)
+    elif path == "/burst":
+        for i in range(5):
+            await ws.send(f"m{i}")
+        await ws.wait_closed()
+    else:  # /silent
+        await ws.wait_closed()
+
+
+@pytest.fixture(scope="module")
+def ws_url() -> Iterator[str]:
+    # The CLI runs its own event loop, so the server gets a loop in a thread
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    port = []
+
+    async def serve() -> None:
+        async with websockets_server.serve(_handler, "127.0.0.1", 0) as server:
+            port.append(server.sockets[0].getsockname()[1])
+            ready.set()
+            await loop.create_future()
+
+    task = loop.create_task(serve())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    assert ready.wait(timeout=5)
+    yield f"ws://127.0.0.1:{port[0]}"
+    # Stop the loop only once the server has shut down
+    task.add_done_callback(lambda _: loop.stop())
+    loop.call_soon_threadsafe(task.cancel)
+    thread.join(timeout=5)
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+def test_ws_send_one(runner: CliRunner, ws_url: str) -> None:
+    r = runner.invoke(app, ["ws", f"{ws_url}/echo", "--send", "hello", "--no-uvloop"])
+    assert r.exit_code == 0, r.output
+    assert "hello" in r.output
+
+
+def test_ws_listen_count(runner: CliRunner, ws_url: str) -> None:
+    r = runner.invoke(app, ["ws", f"{ws_url}/burst", "--listen", "-n", "3"])
+    assert r.exit_code == 0, r.output
+    assert "m0" in r.output and "m2" in r.output
+    assert "m3" not in r.output
+
+
+def test_ws_listen_duration(runner: CliRunner, ws_url: str) -> None:
+    r = runner.invoke(app, ["ws", f"{ws_url}/silent", "--listen", "--duration", "0.2"])
+    assert r.exit_code == 0, r.output
+    assert "Listening" in r.output
+
+
+def test_ws_listen_output_file(runner: CliRunner, ws_url: str, tmp_path: Path) -> None:
+    out = tmp_path / "messages.log"
+    r = runner.invoke(
+        app, ["ws", f"{ws_url}/burst", "--listen", "-n", "2", "-o", str(out)]
+    )
+    assert r.exit_code == 0, r.output
+    assert out.read_text(encoding="utf-8") == "m0\nm1\n"
+    # Not a terminal: with -o the messages only go to the file
+    assert "m0" not in r.output
+
+
+def test_ws_interactive_closes_at_eof(runner: CliRunner, ws_url: str) -> None:
+    # Replies racing the close at EOF may be dropped, so check what was sent
+    _recorded.clear()
+    _record_done.clear()
+    r = runner.invoke(app, ["ws", f"{ws_url}/record", "-i"], input="ping\npong\n")
+    assert r.exit_code == 0, r.output
+    assert _record_done.wait(timeout=5)
+    assert _recorded == ["ping", "pong"]
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [(["--duration", "0"], "--duration"), (["-n", "0"], "--count")],
+)
+def test_ws_rejects_bad_limits(runner: CliRunner, ws_url: str, args, message) -> None:
+    r = runner.invoke(app, ["ws", f"{ws_url}/silent", "--listen", *args])
+    assert r.exit_code == 2
+    assert message in r.output